@@ -13,13 +13,15 @@
 
 import math
 
-# define UNITS
+from UnitSystem import UnitSystem
 
-inch = 1.0                          # define basic units -- output units for length
-sec = 1.0                           # define basic units -- output units for time
-kip = 1.0                           # define basic units -- output units for force
-Slug = kip*math.pow(sec,2)/inch     # define basic units -- output units for mass
-rad = 1.0                           # define basic units -- output units for angles
+# define UNITS
+units = UnitSystem.Imperial         # basic units: inch, kip, sec -- output units
+inch = units.inch                   # define basic units -- output units for length
+sec = units.sec                     # define basic units -- output units for time
+kip = units.kip                     # define basic units -- output units for force
+Slug = units.Slug                   # define basic units -- output units for mass
+rad = units.rad                     # define basic units -- output units for angles
 
 MunitTXT = "Slug (kip-s²/in)"       # define basic unit text for mass output
 LunitTXT = "inch"                   # define basic unit text for length output
@@ -27,58 +29,49 @@ TunitTXT = "sec"                    # define basic unit text for time output
 FunitTXT = "kip"                    # define basic unit text for force output
 AunitTXT = "rad"                    # define basic unit text for angle output
 
-m = inch / 0.0254                   # define basic SI units -- output units
-N = kip / 4448.2216                 # define basic SI units -- output units
-kg = N*math.pow(sec,2)/m            # define basic SI units -- output units
+m = units.m                         # define basic SI units -- output units
+N = units.N                         # define basic SI units -- output units
+kg = units.kg                       # define basic SI units -- output units
 
 
 
 # define engineering units
-ft = 12*inch                        # foot
-
-g = 32.17404856*ft/math.pow(sec,2)  # gravitational acceleration
-
-ton = 1.e3*kg                       # metric tonne equal to 1,000 kilo-gram
-
-degree = 180.0/math.pi*rad          # degree
-
-ksi = kip/math.pow(inch,2)          # kilo-pounds per square inch
-psi = 1.e-3*ksi                     # pounds per square inch
-lbf = 1.e-3*kip                     # pounds force
-plf = lbf/ft                        # pounds per linear foot
-psf = lbf/math.pow(ft,2)            # pounds per square foot
-pcf = lbf/math.pow(ft,3)            # pounds per cubic foot
-
-slug = lbf*math.pow(sec,2)/ft       # Imperial mass = slug or pound-square second per inch
-
-cm = 1.e-2*m                        # centimeter, needed for displacement input in Multiple Support excitation
-mm = 1.e-3*m                        # mili-meter
-
-kN = 1.e3*N                         # kilo-Newton
-MN = 1.e6*N                         # Mega-Newton
-
-kgf = N*g                           # kilo-gram-force
-tonf = kgf/1000.0                   # tonne-force
-
-Pa = N/math.pow(m,2)                # Newton per square meter
-kPa = 1.e3*Pa                       # kilo-Pascal or kilo-Newton per square meter
-MPa = 1.0e6*Pa                      # Mega-Pascal or Newton per square mili-meter or Mega-Newton per square meter
-GPa = 1.0e9*Pa                      # Giga-Pascal or kilo-Newton per square mili-meter or Giga-Newton per square meter
-
-in2 = math.pow(inch,2)              # inch²
-in3 = math.pow(inch,3)              # inch³
-in4 = math.pow(inch,4)              # inch⁴
-ft2 = math.pow(ft,2)                # ft²
-m2 = math.pow(m,2)                  # m²
-m3 = math.pow(m,3)                  # m³
-m4 = math.pow(m,4)                  # m⁴
-cm2 = math.pow(cm,2)                # cm²
-cm3 = math.pow(cm,3)                # cm³
-cm4 = math.pow(cm,4)                # cm⁴
-mm2 = math.pow(mm,2)                # mm²
-mm3 = math.pow(mm,3)                # mm³
-mm4 = math.pow(mm,4)                # mm⁴
-
+g = units.g                         # gravitational acceleration
+ton = units.ton                     # metric tonne equal to 1,000 kilo-gram
+cm = units.cm                       # centimeter, needed for displacement input in Multiple Support excitation
+mm = units.mm                       # mili-meter
+ft = units.ft                       # foot
+kN = units.kN                       # kilo-Newton
+MN = units.MN                       # Mega-Newton
+kgf = units.kgf                     # kilo-gram-force
+tonf = units.tonf                   # tonne-force
+Pa = units.Pa                       # Newton per square meter
+kPa = units.kPa                     # kilo-Pascal or kilo-Newton per square meter
+MPa = units.MPa                     # Mega-Pascal or Newton per square mili-meter or Mega-Newton per square meter
+GPa = units.GPa                     # Giga-Pascal or kilo-Newton per square mili-meter or Giga-Newton per square meter
+degree = units.degree               # degree
+ksi = units.ksi                     # kilo-pounds per square inch
+psi = units.psi                     # pounds per square inch
+lbf = units.lbf                     # pounds force
+plf = units.plf                     # pounds per linear foot
+psf = units.psf                     # pounds per square foot
+pcf = units.pcf                     # pounds per cubic foot
+slug = units.slug                   # Imperial mass = slug or pound-square second per foot
+m2 = units.m2                       # m²
+m3 = units.m3                       # m³
+m4 = units.m4                       # m⁴
+cm2 = units.cm2                     # cm²
+cm3 = units.cm3                     # cm³
+cm4 = units.cm4                     # cm⁴
+mm2 = units.mm2                     # mm²
+mm3 = units.mm3                     # mm³
+mm4 = units.mm4                     # mm⁴
+in2 = units.in2                     # inch²
+in3 = units.in3                     # inch³
+in4 = units.in4                     # inch⁴
+ft2 = units.ft2                     # ft²
+ft3 = units.ft3                     # ft³
+ft4 = units.ft4                     # ft⁴
 
 pi = 2*math.asin(1.0)               # define π
 
@@ -0,0 +1,119 @@
+# -----------------------------------------------------------------------------
+# Batch.py -- batches of analyses in a pool of long-lived worker processes
+#       (c) Farshad Rasuli, 2021-2022
+#
+# E-Mail: farshad.rasuli@gmail.com
+# github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205
+# farshadrasuli.github.io/OpenSeesPy
+# -----------------------------------------------------------------------------
+'''
+A job is a dictionary of a model and an analysis:
+    model       keyword arguments of Frame2D.build, e.g. {'numStory': 5}, or
+                the name of a model file of Frame2D.save
+    analysis    one of analyses:
+                    gravity     gravity analysis
+                    modal       gravity, then the periods of numModes modes
+                                (eigen solver: solver, or Modal.select_solver)
+                    pushover    gravity, then a push-over to the roof drift
+                                ratio maxDrift in increments of incrDrift
+                    transient   gravity, then the ground motion fileName
+                                scaled by scale (see GroundMotion.py)
+    args        keyword arguments of the analysis, e.g. {'numModes': 3}
+
+run_job(job) - run a job in the current process; returns the result
+        dictionary of the analysis, with 'wallTime', or 'error' if the job
+        failed. The domain is wiped afterwards, and the modes (Modal.py) and
+        the fiber sections (Wsection.py) of the last job are dropped first.
+open_pool(numProcess) - a pool of numProcess worker processes (None: all cores)
+run(jobs, numProcess, pool) - run the jobs in a pool, the one given or a new
+        one, and return the results in the order of the jobs
+
+A worker imports Python, OpenSeesPy and the modules of Example 5 once and then
+runs job after job, wiping the domain in between, instead of paying the start
+of a new interpreter per analysis (see Ex5.Benchmark.Batch.py). matplotlib is
+never imported. Unlike ForkPool.py, a job starts from an empty domain, so the
+jobs of a batch can be different models.
+'''
+
+import time
+import multiprocessing
+
+import numpy as np
+
+import openseespy.opensees as ops
+
+import Frame2D as Frame2D
+import Modal as Modal
+import Wsection as Wsection
+import Pushover as Pushover
+import GroundMotion as GroundMotion
+
+
+def _gravity(model):
+    ok = Frame2D.gravity(model)
+    return {
+        'converged': ok == 0,
+        'roofVertDisp': ops.nodeDisp(model['tagCtrlNode'], 2),
+        }
+
+
+def _modal(model, numModes=3, solver=None):
+    result = _gravity(model)
+    result['period'] = Modal.eigen(numModes, solver)['period']
+    return result
+
+
+def _pushover(model, maxDrift=0.1, incrDrift=1.e-4):
+    result = _gravity(model)
+    Frame2D.lateral_loads(model)
+    result['curve'] = np.zeros((0, 2))
+    if result['converged']:
+        ok, result['curve'], stats = Pushover.push(model, maxDrift, incrDrift)
+    return result
+
+
+def _transient(model, fileName, scale=1.0, driftLimit=None, dampRatio=0.02, tFree=0.0):
+    result = _gravity(model)
+    result.update(GroundMotion._transient(model, fileName, scale, driftLimit, dampRatio, tFree))
+    return result
+
+
+# analyses of a job: function(model, **args)
+analyses = {
+    'gravity': _gravity,
+    'modal': _modal,
+    'pushover': _pushover,
+    'transient': _transient,
+    }
+
+
+def run_job(job):
+    tStart = time.perf_counter()
+    # the state of the modules of the last job: its modes and the fiber layout of its sections
+    Modal.clear_cache()
+    Wsection.clear()
+    try:
+        if isinstance(job['model'], str):
+            model = Frame2D.load(job['model'])
+        else:
+            model = Frame2D.build(**job['model'])
+        result = analyses[job['analysis']](model, **job.get('args', {}))
+    except Exception as error:
+        # a failed job must not take the worker, and the rest of the batch, with it
+        result = {'error': repr(error)}
+    finally:
+        ops.wipe()
+    result['wallTime'] = time.perf_counter() - tStart
+    return result
+
+
+def open_pool(numProcess=None):
+    # workers are kept for the life of the pool, no maxtasksperchild
+    return multiprocessing.Pool(numProcess)
+
+
+def run(jobs, numProcess=None, pool=None):
+    if pool is not None:
+        return pool.map(run_job, jobs, chunksize=1)
+    with open_pool(numProcess) as pool:
+        return pool.map(run_job, jobs, chunksize=1)
@@ -0,0 +1,105 @@
+# -----------------------------------------------------------------------------
+# Capacity.py -- post-processing of the push-over capacity curve
+#       (c) Farshad Rasuli, 2021-2022
+#
+# E-Mail: farshad.rasuli@gmail.com
+# github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205
+# farshadrasuli.github.io/OpenSeesPy
+#
+# Reference:
+# ASCE/SEI 41-17, Seismic Evaluation and Retrofit of Existing Buildings,
+#       Section 7.4.3.2.4, idealized force-displacement curve.
+# -----------------------------------------------------------------------------
+'''
+load(baseReactionFile, roofDispFile, dof) - capacity curve from the recorder
+        files of the push-over script (baseReaction and freeNodeDisp, text or
+        binary, with '-time'); returns roof displacement and base shear arrays.
+        The reactions of all support nodes are summed in one operation.
+bilinear(roofDisp, baseShear, drop) - bilinear idealization of the capacity
+        curve; returns a dictionary:
+            Ke          effective elastic stiffness, secant at 0.6 Vy
+            Vy, dy      effective yield base shear and displacement
+            Vmax, dMax  peak base shear and its displacement
+            Vu, du      ultimate point: the curve drops to (1-drop)*Vmax after
+                        the peak, or its last point
+            alpha       post-yield stiffness ratio, of the line (dy, Vy)-(du, Vu)
+            ductility   du/dy
+            overstrength Vmax/Vy
+
+The yield point follows ASCE 41: the first line passes through the curve at
+0.6 Vy and the area under the bilinear curve equals the area under the
+capacity curve up to du. Instead of iterating on Vy, the area balance is
+evaluated for a vector of trial Vy at once and its root interpolated, so a
+10,000-step curve takes about a millisecond.
+'''
+
+import numpy as np
+
+import Recorders as Recorders
+
+
+# number of trial yield base shears evaluated at once
+numTrials = 256
+
+
+def load(baseReactionFile, roofDispFile, dof=1, ndf=3):
+    reactions = Recorders.load(baseReactionFile)
+    disp = Recorders.load(roofDispFile)
+    # columns: time, then ndf columns per node
+    baseShear = -reactions[:, dof::ndf].sum(axis=1)
+    roofDisp = np.asarray(disp[:, dof])
+    return roofDisp, baseShear
+
+
+def bilinear(roofDisp, baseShear, drop=0.2):
+    d = np.asarray(roofDisp, dtype=float)
+    V = np.asarray(baseShear, dtype=float)
+
+    # the curve starts at the origin
+    if d[0] != 0. or V[0] != 0.:
+        d = np.concatenate([[0.], d])
+        V = np.concatenate([[0.], V])
+
+    iMax = V.argmax()
+    Vmax, dMax = V[iMax], d[iMax]
+
+    # ultimate point: first drop below (1-drop)*Vmax after the peak
+    below = np.flatnonzero(V[iMax:] < (1. - drop)*Vmax)
+    iu = iMax + below[0] if len(below) else len(V) - 1
+    du, Vu = d[iu], V[iu]
+    area = 0.5*np.sum(np.diff(d[:iu + 1])*(V[1:iu + 1] + V[:iu]))
+
+    # displacement at which the curve first reaches a base shear, on its monotonic envelope before the peak
+    envelope = np.maximum.accumulate(V[:iMax + 1])
+    rise = np.concatenate([[True], np.diff(envelope) > 0])
+
+    # area under the bilinear curve for every trial Vy
+    Vy = np.linspace(0.3*Vmax, Vmax, numTrials)
+    Ke = 0.6*Vy/np.interp(0.6*Vy, envelope[rise], d[:iMax + 1][rise])
+    dy = np.minimum(Vy/Ke, du)
+    residual = 0.5*dy*Vy + 0.5*(du - dy)*(Vy + Vu) - area
+
+    # root of the area balance, between the last trial below and the first above it
+    sign = np.flatnonzero(np.diff(np.sign(residual)) != 0)
+    if len(sign):
+        i = sign[0]
+        t = residual[i]/(residual[i] - residual[i + 1])
+        Vy = Vy[i] + t*(Vy[i + 1] - Vy[i])
+        Ke = Ke[i] + t*(Ke[i + 1] - Ke[i])
+    else:
+        i = np.abs(residual).argmin()
+        Vy, Ke = Vy[i], Ke[i]
+    dy = Vy/Ke
+
+    return {
+        'Ke': float(Ke),
+        'Vy': float(Vy),
+        'dy': float(dy),
+        'Vmax': float(Vmax),
+        'dMax': float(dMax),
+        'Vu': float(Vu),
+        'du': float(du),
+        'alpha': float((Vu - Vy)/(du - dy)/Ke) if du > dy else 0.,
+        'ductility': float(du/dy),
+        'overstrength': float(Vmax/Vy),
+        }
@@ -0,0 +1,122 @@
+# -----------------------------------------------------------------------------
+# Checkpoint.py -- periodic checkpoints and restart of a static analysis
+#       (c) Farshad Rasuli, 2021-2022
+#
+# E-Mail: farshad.rasuli@gmail.com
+# github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205
+# farshadrasuli.github.io/OpenSeesPy
+# -----------------------------------------------------------------------------
+'''
+save(ckDir, step, key, **arrays) - write a checkpoint of the nodal displacements
+        and time after `step` converged steps, with the key of the model
+        (Model.key) and any NumPy arrays of the caller (e.g. the capacity
+        curve recorded so far)
+load(ckDir, key) - the last checkpoint written in ckDir, as a dictionary
+        {step, time, key, nodeTags, nodeDisp, arrays...}, or None; a
+        checkpoint of another model than `key` is rejected (None, with a
+        warning)
+replay(checkpoint, tagCtrlNode, tagCtrlDOF, incrDisp, tol, maxNumIter) - push
+        the rebuilt, gravity-loaded model back to the control displacement of
+        the checkpoint with a coarse increment; returns 0, or -1 if it does not
+        get there or if the displacements of any node differ from those of the
+        checkpoint by more than replayTol (relative to the largest displacement
+        of the checkpoint in the same DOF)
+start_over(tol, maxNumIter) - revert the domain to its start and apply the
+        constant (gravity) loads again, e.g. after a failed replay; the
+        recorders and the analysis stay defined, returns the result of
+        ops.analyze
+remove(ckDir) - delete the checkpoint of a finished analysis
+
+A checkpoint does not hold the state of the domain: in OpenSeesPy 3.7
+ops.restore of a database written by ops.save crashes the interpreter with the
+fiber beam-column elements of this frame. To resume, the model is rebuilt,
+gravity is applied again and the push-over is replayed to the control
+displacement of the checkpoint with an increment of replayFactor*incrDisp.
+The material state is that of a monotonic push in a few large steps, not the
+state of the interrupted run; for the bilinear fibers of this frame the two
+agree to round-off, and a replay that does not reproduce the displacements of
+the checkpoint is rejected.
+
+The checkpoint file is written to a temporary file and renamed, so a process
+killed while writing leaves the previous checkpoint intact.
+'''
+
+import os
+import warnings
+
+import numpy as np
+
+import openseespy.opensees as ops
+
+import Pushover as Pushover
+
+
+# checkpoint file, in ckDir
+checkpointFile = 'checkpoint.npz'
+
+# increment of the replay, in multiples of the increment of the analysis
+replayFactor = 10
+
+# largest difference of the replayed nodal displacements from those of the checkpoint, relative to the
+# largest displacement of the checkpoint in the same DOF
+replayTol = 1.e-6
+
+
+def save(ckDir, step, key, **arrays):
+    if not os.path.exists(ckDir):
+        os.makedirs(ckDir)
+
+    nodeTags = ops.getNodeTags()
+    fileName = os.path.join(ckDir, checkpointFile)
+    with open(fileName + '.tmp', 'wb') as file:
+        np.savez(file, step=step, time=ops.getTime(), key=key, nodeTags=nodeTags,
+                 nodeDisp=np.array([ops.nodeDisp(nodeTag) for nodeTag in nodeTags]), **arrays)
+    os.replace(fileName + '.tmp', fileName)
+
+
+def load(ckDir, key=None):
+    fileName = os.path.join(ckDir, checkpointFile)
+    if not os.path.exists(fileName):
+        return None
+    with np.load(fileName) as data:
+        checkpoint = dict(data)
+    checkpoint['step'] = int(checkpoint['step'])
+    checkpoint['time'] = float(checkpoint['time'])
+    checkpoint['key'] = str(checkpoint['key']) if 'key' in checkpoint else None
+    if key is not None and checkpoint['key'] != key:
+        warnings.warn('the checkpoint in %s is of another model, it is ignored' % ckDir)
+        return None
+    return checkpoint
+
+
+def replay(checkpoint, tagCtrlNode, tagCtrlDOF, incrDisp, tol, maxNumIter):
+    index = list(checkpoint['nodeTags']).index(tagCtrlNode)
+    ctrlDisp = checkpoint['nodeDisp'][index, tagCtrlDOF - 1]
+    for step in Pushover.adaptive_steps(tagCtrlNode, tagCtrlDOF, ctrlDisp, replayFactor*incrDisp, tol, maxNumIter,
+                                        minIncrDisp=incrDisp/2**6):
+        pass
+    if ctrlDisp - ops.nodeDisp(tagCtrlNode, tagCtrlDOF) > 0.01*incrDisp:
+        return -1
+
+    # every node, not only the control node, must be where the checkpoint left it
+    nodeDisp = np.array([ops.nodeDisp(int(nodeTag)) for nodeTag in checkpoint['nodeTags']])
+    error = np.abs(nodeDisp - checkpoint['nodeDisp']).max(axis=0)
+    if np.any(error > replayTol*np.abs(checkpoint['nodeDisp']).max(axis=0)):
+        return -1
+    return 0
+
+
+def start_over(tol, maxNumIter):
+    # back to zero displacements and the initial material state at time 0; the loads of the constant
+    # patterns stay, and are applied again in a single step of zero load increment
+    ops.reset()
+    ops.test('NormDispIncr', tol, maxNumIter)
+    ops.algorithm('Newton')
+    ops.integrator('LoadControl', 0.0)
+    return ops.analyze(1)
+
+
+def remove(ckDir):
+    fileName = os.path.join(ckDir, checkpointFile)
+    if os.path.exists(fileName):
+        os.remove(fileName)
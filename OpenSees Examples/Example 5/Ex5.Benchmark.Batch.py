@@ -0,0 +1,81 @@
+# -----------------------------------------------------------------------------
+# Example 5. 2D Frame --  Benchmark: batch of short analyses, a new interpreter
+#                         per analysis vs. a pool of long-lived workers
+#
+#     This file provided by (c) Farshad Rasuli, 2021-2022.
+#
+# E-Mail: <farshad.rasuli@gmail.com>
+# <github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205/>
+# <farshadrasuli.github.io/OpenSeesPy/>
+# -----------------------------------------------------------------------------
+
+# import other modules
+import os
+import sys
+import time
+import subprocess
+import concurrent.futures
+# import auxiliary *.py files
+import Batch as Batch
+
+
+
+
+
+
+
+
+
+
+# Set up ======================================================================
+
+# short analyses: gravity and the first 3 modes of frames of 3 to 6 stories
+# with the band solver, the dense one that Modal selects for these sizes prints a warning per job
+jobs = [{'model': {'numStory': numStory, 'numBay': numBay}, 'analysis': 'modal',
+         'args': {'numModes': 3, 'solver': '-genBandArpack'}}
+        for numStory in range(3, 7) for numBay in range(2, 6)]
+
+# number of worker processes, of the pool and of the interpreters running at a time
+numProcess = 4
+
+
+
+
+
+
+
+
+
+
+# Benchmark ===================================================================
+
+def run_interpreter(job):
+    # a new interpreter per analysis, as when running a script per model
+    subprocess.run([sys.executable, '-c', 'import Batch; Batch.run_job(%r)' % (job,)],
+                   cwd=os.path.dirname(os.path.abspath(__file__)), check=True, capture_output=True)
+
+
+# the guard is required by the process pool on platforms that spawn workers
+if __name__ == '__main__':
+
+    tStart = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(numProcess) as threads:
+        list(threads.map(run_interpreter, jobs))
+    interpreterTime = time.perf_counter() - tStart
+
+    tStart = time.perf_counter()
+    with Batch.open_pool(numProcess) as pool:
+        results = Batch.run(jobs, pool=pool)
+    poolTime = time.perf_counter() - tStart
+
+    analysisTime = sum(result['wallTime'] for result in results)
+    errors = [result['error'] for result in results if 'error' in result]
+
+    print('%d jobs, %d processes, %.1f ms of analysis per job' % (len(jobs), numProcess,
+                                                                  analysisTime/len(jobs)*1.e3))
+    print('%-28s %10s %14s' % ('', 'time [sec]', 'jobs per sec'))
+    print('%-28s %10.2f %14.1f' % ('interpreter per job', interpreterTime, len(jobs)/interpreterTime))
+    print('%-28s %10.2f %14.1f' % ('persistent worker pool', poolTime, len(jobs)/poolTime))
+    print('speed-up %.1f' % (interpreterTime/poolTime))
+    if errors:
+        print('failed jobs: ' + '; '.join(errors))
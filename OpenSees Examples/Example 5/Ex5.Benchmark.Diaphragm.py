@@ -0,0 +1,85 @@
+# -----------------------------------------------------------------------------
+# Example 5. 2D Frame --  Benchmark: rigid floor diaphragm (equalDOF + Transformation)
+#
+#     This file provided by (c) Farshad Rasuli, 2021-2022.
+#
+# E-Mail: <farshad.rasuli@gmail.com>
+# <github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205/>
+# <farshadrasuli.github.io/OpenSeesPy/>
+# -----------------------------------------------------------------------------
+
+# import the OpenSeesPy module
+import openseespy.opensees as ops
+# import other modules
+import time
+# import auxiliary *.py files
+import LibUnits as unit
+import Frame2D as Frame2D
+import Pushover as Pushover
+
+
+
+
+
+
+
+
+
+
+# Set up ======================================================================
+
+# frame sizes: numStory, numBay
+frameSizes = [[3, 3], [10, 5], [20, 10], [30, 20]]
+
+# push-over steps timed after gravity, increment of roof drift ratio
+numSteps = 50
+incrDrift = 1.e-4
+
+
+
+
+
+
+
+
+
+
+# Benchmark ===================================================================
+
+def push(numStory, numBay, diaphragm):
+    model = Frame2D.build(numStory, numBay, diaphragm=diaphragm)
+
+    tStart = time.perf_counter()
+    Frame2D.gravity(model)
+    gravityTime = time.perf_counter() - tStart
+    # equations of the analysis, the free DOFs less the DOFs constrained by the diaphragm
+    numEqn = ops.systemSize()
+
+    Frame2D.lateral_loads(model)
+    tStart = time.perf_counter()
+    ok, curve, stats = Pushover.push(model, numSteps*incrDrift, incrDrift)
+    pushTime = time.perf_counter() - tStart
+
+    baseShear = curve[-1, 1] if len(curve) else float('nan')
+    ops.wipe()
+
+    return numEqn, gravityTime, pushTime/max(stats['steps'], 1), stats['iterations']/max(stats['steps'], 1), baseShear
+
+
+print('%8s %6s %10s %8s %13s %14s %11s %12s %10s' % ('numStory', 'numBay', 'diaphragm', 'numEqn', 'gravity [ms]',
+                                                     'per step [ms]', 'iter/step', 'base shear', 'diff [%]'))
+
+for numStory, numBay in frameSizes:
+    reference = None
+    for diaphragm in [False, True]:
+        numEqn, gravityTime, stepTime, iterations, baseShear = push(numStory, numBay, diaphragm)
+        if reference is None:
+            reference = baseShear
+        print('%8d %6d %10s %8d %13.2f %14.2f %11.2f %8.1f %3s %10.3f' % (numStory, numBay, diaphragm, numEqn,
+                                                                          gravityTime*1.e3, stepTime*1.e3, iterations,
+                                                                          baseShear, unit.FunitTXT,
+                                                                          (baseShear/reference - 1.)*100))
+
+# the diaphragm removes numBay equations per floor (about 30%), and the axial deformation of the beams with them;
+# the Transformation handler transforms the stiffness of every element framing into a constrained node at each
+# iteration, which costs more than the equations saved for these fiber frames (about 2-2.6 times the time per step)
@@ -0,0 +1,88 @@
+# -----------------------------------------------------------------------------
+# Example 5. 2D Frame --  Benchmark: element formulations
+#
+#     This file provided by (c) Farshad Rasuli, 2021-2022.
+#
+# E-Mail: <farshad.rasuli@gmail.com>
+# <github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205/>
+# <farshadrasuli.github.io/OpenSeesPy/>
+# -----------------------------------------------------------------------------
+
+# import the OpenSeesPy module
+import openseespy.opensees as ops
+# import other modules
+import time
+import numpy as np
+# import auxiliary *.py files
+import LibUnits as unit
+import Frame2D as Frame2D
+import Pushover as Pushover
+
+
+
+
+
+
+
+
+
+
+# Set up ======================================================================
+
+# element formulations: label, eleType, numIntgrPts, hingeLength (in section depths, forceBeamColumn only);
+# the first one is the baseline
+formulations = [
+    ['Example 5',      'nonlinearBeamColumn', 5, 1.0],
+    ['Lobatto 3',      'nonlinearBeamColumn', 3, 1.0],
+    ['HingeRadau 1d',  'forceBeamColumn',     5, 1.0],
+    ['HingeRadau .5d', 'forceBeamColumn',     5, 0.5],
+    ['Legendre 5',     'dispBeamColumn',      5, 1.0],
+    ]
+
+# push-over to maxDrift of roof drift ratio, in increments of incrDrift
+maxDrift = 0.1
+incrDrift = 1.e-4
+
+
+
+
+
+
+
+
+
+
+# Benchmark ===================================================================
+
+def push(eleType, numIntgrPts, hingeLength):
+    model = Frame2D.build(numIntgrPts=numIntgrPts, eleType=eleType, hingeLength=hingeLength)
+    Frame2D.gravity(model)
+    Frame2D.lateral_loads(model)
+
+    tStart = time.perf_counter()
+    ok, curve, stats = Pushover.push(model, maxDrift, incrDrift)
+    wallTime = time.perf_counter() - tStart
+    ops.wipe()
+
+    return wallTime, stats['steps'], stats['iterations'], curve
+
+
+print('%-15s %-20s %10s %6s %14s %10s %14s %18s' % ('formulation', 'element', 'push [sec]', 'steps', 'per step [ms]',
+                                                    'iter/step', 'max base shear', 'curve diff [%]'))
+
+baseline = None
+for label, eleType, numIntgrPts, hingeLength in formulations:
+    wallTime, numSteps, iterations, curve = push(eleType, numIntgrPts, hingeLength)
+    if baseline is None:
+        baseline = curve
+    # largest difference of the base shear at the roof displacements of the baseline, relative to its peak
+    diff = np.abs(np.interp(baseline[:, 0], curve[:, 0], curve[:, 1], right=np.nan) - baseline[:, 1])
+    print('%-15s %-20s %10.2f %6d %14.2f %10.2f %10.1f %3s %18.2f' % (label, eleType, wallTime, numSteps,
+                                                                      wallTime/max(numSteps, 1)*1.e3,
+                                                                      iterations/max(numSteps, 1), curve[:, 1].max(),
+                                                                      unit.FunitTXT,
+                                                                      np.nanmax(diff)/baseline[:, 1].max()*100))
+
+# a HingeRadau element evaluates 2 fiber sections instead of 5 and takes about half the time per step; its capacity
+# curve depends on the assumed hinge length. A single dispBeamColumn per member assumes a linear curvature and
+# overestimates the strength; it needs several elements per member to converge to the force-based result.
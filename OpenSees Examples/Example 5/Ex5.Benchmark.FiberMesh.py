@@ -0,0 +1,73 @@
+# -----------------------------------------------------------------------------
+# Example 5. 2D Frame --  Benchmark: push-over with the recommended fiber mesh
+#
+#     This file provided by (c) Farshad Rasuli, 2021-2022.
+#
+# E-Mail: <farshad.rasuli@gmail.com>
+# <github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205/>
+# <farshadrasuli.github.io/OpenSeesPy/>
+# -----------------------------------------------------------------------------
+
+# import the OpenSeesPy module
+import openseespy.opensees as ops
+# import other modules
+import time
+# import auxiliary *.py files
+import LibUnits as unit
+import Frame2D as Frame2D
+import Pushover as Pushover
+import Wshapes as Wshapes
+
+
+
+
+
+
+
+
+
+
+# Set up ======================================================================
+
+# tolerance on the section properties implied by the fiber mesh
+tolMesh = 0.005
+
+# fiber mesh of Example 5: nfdw, nftw, nfbf, nftf
+meshEx5 = [16, 2, 16, 4]
+
+# coarsest mesh within the tolerance for both sections of Example 5
+meshes = [Wshapes.recommend_mesh(*(Wshapes.shape(name)[key] for key in ('d', 'bf', 'tf', 'tw')), tol=tolMesh)
+          for name in Frame2D.sectionsEx5.values()]
+meshTol = [max(mesh[key] for mesh in meshes) for key in ('nfdw', 'nftw', 'nfbf', 'nftf')]
+
+
+def push(nfdw, nftw, nfbf, nftf):
+    model = Frame2D.build(nfdw=nfdw, nftw=nftw, nfbf=nfbf, nftf=nftf)
+    Frame2D.gravity(model)
+    Frame2D.lateral_loads(model)
+    ops.analysis('Static')
+
+    tStart = time.perf_counter()
+    ok, curve, stats = Pushover.push(model, 0.1, 1.e-4)
+    wallTime = time.perf_counter() - tStart
+
+    ops.wipe()
+    return wallTime, curve[:, 1].max(initial=0.)
+
+
+
+
+
+
+
+
+
+
+# Benchmark ===================================================================
+
+print('%-24s %9s %12s %18s' % ('mesh nfdw,nftw,nfbf,nftf', 'fibers', 'push [sec]', 'max base shear'))
+for label, mesh in [['Example 5', meshEx5], ['tol = %g' % tolMesh, meshTol]]:
+    nfdw, nftw, nfbf, nftf = mesh
+    wallTime, maxBaseShear = push(*mesh)
+    print('%-12s %11s %9d %12.2f %14.1f %s' % (label, ','.join(map(str, mesh)), 2*nfbf*nftf + nftw*nfdw,
+                                               wallTime, maxBaseShear, unit.FunitTXT))
@@ -0,0 +1,83 @@
+# -----------------------------------------------------------------------------
+# Example 5. 2D Frame --  Benchmark: build and load time of the parametric frame builder
+#
+#     This file provided by (c) Farshad Rasuli, 2021-2022.
+#
+# E-Mail: <farshad.rasuli@gmail.com>
+# <github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205/>
+# <farshadrasuli.github.io/OpenSeesPy/>
+# -----------------------------------------------------------------------------
+
+# import the OpenSeesPy module
+import openseespy.opensees as ops
+# import other modules
+import os
+import tempfile
+import timeit
+# import auxiliary *.py files
+import Frame2D as Frame2D
+import Modal as Modal
+import Model as Model
+
+
+
+
+
+
+
+
+
+
+# Set up ======================================================================
+
+# number of repetitions of each timing
+numRepeat = 5
+
+# frame sizes: numStory, numBay
+frameSizes = [[3, 3], [5, 5], [10, 5], [10, 10], [20, 5], [20, 10], [50, 50]]
+
+# model file of the load timing
+fileName = os.path.join(tempfile.gettempdir(), 'Ex5.Benchmark.Frame2D.npz')
+
+
+
+
+
+
+
+
+
+
+# Benchmark ===================================================================
+
+print('%8s %6s %8s %11s %10s %14s %10s %12s %14s' % ('numStory', 'numBay', 'numEle', 'define [ms]', 'build [ms]',
+                                                      'per ele [us]', 'load [ms]', 'key [ms]', 'JSON key [ms]'))
+
+for numStory, numBay in frameSizes:
+    defineTime = min(timeit.repeat(lambda: Frame2D.define(numStory, numBay), number=1, repeat=numRepeat))
+
+    # build and load in turn, each wipes a domain of the same size
+    model = Frame2D.build(numStory, numBay)
+    numEle = len(ops.getEleTags())
+    Frame2D.save(fileName, model)
+    buildTimes, loadTimes = [], []
+    for repeat in range(numRepeat):
+        buildTimes.append(min(timeit.repeat(lambda: Frame2D.build(numStory, numBay), number=1, repeat=1)))
+        loadTimes.append(min(timeit.repeat(lambda: Frame2D.load(fileName), number=1, repeat=1)))
+    buildTime, loadTime = min(buildTimes), min(loadTimes)
+
+    # cache key of the definition arrays, and of the JSON print of the domain (Modal.model_key)
+    keyTime = min(timeit.repeat(lambda: Model.key(model['definition']), number=1, repeat=numRepeat))
+    jsonKeyTime = min(timeit.repeat(Modal.model_key, number=1, repeat=numRepeat))
+
+    print('%8d %6d %8d %11.2f %10.2f %14.1f %10.2f %12.3f %14.2f' % (numStory, numBay, numEle, defineTime*1.e3,
+                                                                  buildTime*1.e3, buildTime/numEle*1.e6,
+                                                                  loadTime*1.e3, keyTime*1.e3, jsonKeyTime*1.e3))
+
+os.remove(fileName)
+
+# build time per element stays about constant, i.e. build time scales linearly with model size;
+# most of it is spent in the element constructors of OpenSees, which a load from the file repeats:
+# a load saves only the define time and adds the read of the .npz, so it is not faster than a build
+
+ops.wipe()
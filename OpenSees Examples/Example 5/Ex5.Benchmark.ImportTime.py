@@ -0,0 +1,85 @@
+# -----------------------------------------------------------------------------
+# Example 5. 2D Frame --  Benchmark: start-up (import) time of the analysis path
+#
+#     This file provided by (c) Farshad Rasuli, 2021-2022.
+#
+# E-Mail: <farshad.rasuli@gmail.com>
+# <github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205/>
+# <farshadrasuli.github.io/OpenSeesPy/>
+# -----------------------------------------------------------------------------
+
+# import other modules
+import os
+import re
+import sys
+import subprocess
+
+
+
+
+
+
+
+
+
+
+# Set up ======================================================================
+
+# modules imported by an analysis run (no plotting)
+analysisModules = ['openseespy.opensees', 'LibUnits', 'Wsection', 'Frame2D', 'StreamRecorder', 'Pushover', 'Modal',
+                   'Checkpoint', 'Profiler', 'Capacity', 'GroundMotion', 'IDA', 'Sweep', 'Solver', 'Render',
+                   'Transient', 'Model', 'Batch']
+
+# modules that must not be imported by the analysis path
+plottingModules = ['matplotlib', 'openseespy.postprocessing.Get_Rendering', 'openseespy.postprocessing.ops_vis']
+
+# budget of the cumulative import time of the analysis path
+budget = 0.5    # sec
+
+# number of repetitions, the fastest is kept
+numRepeat = 3
+
+# number of slowest modules listed
+numSlowest = 10
+
+
+
+
+
+
+
+
+
+
+# Benchmark ===================================================================
+
+def import_times():
+    # cumulative import time (microseconds) of every module, from `python -X importtime` in a new interpreter
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + ', '.join(analysisModules)],
+                             cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True)
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr)
+    times = {}
+    for match in re.finditer(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$', process.stderr, re.MULTILINE):
+        times[match.group(4)] = (int(match.group(2)), len(match.group(3)))
+    return times
+
+
+runs = [import_times() for repeat in range(numRepeat)]
+times = min(runs, key=lambda times: sum(cumulative for cumulative, depth in times.values() if depth == 1))
+
+# top-level imports (depth 1) add up to the start-up time
+total = sum(cumulative for cumulative, depth in times.values() if depth == 1)*1.e-6
+
+print('%-48s %12s' % ('module (top-level imports)', 'time [ms]'))
+topLevel = sorted((cumulative, name) for name, (cumulative, depth) in times.items() if depth == 1)[::-1]
+for cumulative, name in topLevel[:numSlowest]:
+    print('%-48s %12.1f' % (name, cumulative*1.e-3))
+print('%-48s %12.1f   (budget %.0f ms)' % ('total', total*1.e3, budget*1.e3))
+
+plotting = [name for name in times if any(name == module or name.startswith(module + '.') for module in plottingModules)]
+if plotting:
+    print('plotting modules imported by the analysis path: ' + ', '.join(sorted(plotting)[:numSlowest]))
+
+if total > budget or plotting:
+    sys.exit(1)
@@ -0,0 +1,77 @@
+# -----------------------------------------------------------------------------
+# Example 5. 2D Frame --  Benchmark: system, numberer and constraint handler
+#
+#     This file provided by (c) Farshad Rasuli, 2021-2022.
+#
+# E-Mail: <farshad.rasuli@gmail.com>
+# <github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205/>
+# <farshadrasuli.github.io/OpenSeesPy/>
+# -----------------------------------------------------------------------------
+
+# import other modules
+import os
+import csv
+# import auxiliary *.py files
+import Solver as Solver
+
+
+
+
+
+
+
+
+
+
+# Set up ======================================================================
+
+# define a name for model
+modelName = 'Ex5-2D-Frame-Fiber-Wsection'
+
+# set up name of output data directory
+outDir = modelName + '_Output'
+# create data directory
+if not os.path.exists(outDir):
+    os.makedirs(outDir)
+
+# frame sizes: numStory, numBay
+frameSizes = [[3, 3], [10, 5], [20, 10]]
+
+# push-over steps timed after the gravity analysis
+numSteps = 20
+
+# number of repetitions of each timing
+numRepeat = 3
+
+
+
+
+
+
+
+
+
+
+# Benchmark ===================================================================
+
+# the guard is required by the process pool on platforms that spawn workers
+if __name__ == '__main__':
+
+    rows = Solver.benchmark(frameSizes, numSteps, numRepeat)
+
+    print('%8s %6s %6s %-12s %-8s %-16s %10s' % ('numStory', 'numBay', 'numDOF', 'system', 'numberer',
+                                                 'constraints', 'time [ms]'))
+    for row in rows:
+        print('%8d %6d %6s %-12s %-8s %-16s %10s' % (row['numStory'], row['numBay'], row['numDOF'], row['system'],
+                                                     row['numberer'], row['constraints'],
+                                                     '%.1f' % (row['time']*1.e3) if row['valid'] else 'invalid'))
+
+    with open(outDir + '/SolverBenchmark.csv', 'w', newline='') as file:
+        writer = csv.DictWriter(file, list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+    # table of Solver.select, e.g. Solver.auto(table) before ops.analysis
+    print('\nfastest valid combination by model size:')
+    for row in Solver.fastest(rows):
+        print(row)
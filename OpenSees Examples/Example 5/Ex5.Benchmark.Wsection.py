@@ -0,0 +1,76 @@
+# -----------------------------------------------------------------------------
+# Example 5. 2D Frame --  Benchmark: W-Section definition with/without plotting
+#
+#     This file provided by (c) Farshad Rasuli, 2021-2022.
+#
+# E-Mail: <farshad.rasuli@gmail.com>
+# <github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205/>
+# <farshadrasuli.github.io/OpenSeesPy/>
+# -----------------------------------------------------------------------------
+
+# import the OpenSeesPy module
+import openseespy.opensees as ops
+# import other modules
+import tempfile
+import timeit
+# import auxiliary *.py files
+import LibUnits as unit
+import Wsection as Wsection
+
+
+
+
+
+
+
+
+
+
+# Set up ======================================================================
+
+# number of repetitions of each timing
+numRepeat = 20
+
+# Hardening Material
+matHardening = 1
+Es = 29000*unit.ksi
+Fy = 60.0*unit.ksi
+
+# sections of Example 5
+#             secTag, secTitle,                    d,                bf,                tf,                tw, nfdw, nftw, nfbf, nftf
+sections = [[      1, 'W27x114', 27.29*unit.inch, 10.07*unit.inch,  0.93*unit.inch,  0.57*unit.inch,   16,    2,   16,    4],
+            [      4,  'W24x94', 24.31*unit.inch, 9.065*unit.inch, 0.875*unit.inch, 0.515*unit.inch,   16,    2,   16,    4]]
+
+
+def build_sections(plot=False, figDir=None):
+    ops.wipe()
+    ops.model('basic', '-ndm', 2, '-ndf', 3)
+    ops.uniaxialMaterial('Hardening', matHardening, Es, Fy, 0.0, 1.e3, 0.)
+    for secTag, secTitle, d, bf, tf, tw, nfdw, nftw, nfbf, nftf in sections:
+        Wsection.section(secTag, secTitle, matHardening, d, bf, tf, tw, nfdw, nftw, nfbf, nftf)
+    if plot:
+        Wsection.plot_sections(figDir=figDir)
+
+
+
+
+
+
+
+
+
+
+# Benchmark ===================================================================
+
+timeNoPlot = min(timeit.repeat(lambda: build_sections(), number=1, repeat=numRepeat))
+print('Sections without plotting: %10.3f ms' % (timeNoPlot*1.e3))
+
+try:
+    with tempfile.TemporaryDirectory() as figDir:
+        timePlot = min(timeit.repeat(lambda: build_sections(True, figDir), number=1, repeat=numRepeat))
+    print('Sections with plotting:    %10.3f ms' % (timePlot*1.e3))
+    print('Plotting overhead:         %10.1f x' % (timePlot/timeNoPlot))
+except ImportError as error:
+    print('Sections with plotting:    skipped (%s)' % error)
+
+ops.wipe()
@@ -0,0 +1,101 @@
+# -----------------------------------------------------------------------------
+# Example 5. 2D Frame --  Check: the same record at every support reproduces
+#                         the UniformExcitation response
+#
+#     This file provided by (c) Farshad Rasuli, 2021-2022.
+#
+# E-Mail: <farshad.rasuli@gmail.com>
+# <github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205/>
+# <farshadrasuli.github.io/OpenSeesPy/>
+# -----------------------------------------------------------------------------
+
+# import the OpenSeesPy module
+import openseespy.opensees as ops
+# import other modules
+import os
+import sys
+# import auxiliary *.py files
+import LibUnits as unit
+import Frame2D as Frame2D
+import Transient as Transient
+import GroundMotion as GroundMotion
+
+
+
+
+
+
+
+
+
+
+# Set up ======================================================================
+
+# ground-motion file directory of the ground-motion script, the first record is used
+GMDir = 'Ex5-2D-Frame-Fiber-Wsection_Ground-motions'
+
+# ground-motion scale factor
+GMScale = 1.0
+
+# sub-steps per time step of the record, the imposed support motion needs finer steps than the inertia loads
+numSubSteps = 5
+
+# largest relative difference of the peak responses
+tolerance = 0.01
+
+
+
+
+
+
+
+
+
+
+# Check =======================================================================
+
+def run(excitation, fileName):
+    model = Frame2D.build()
+    Frame2D.gravity(model)
+    ops.loadConst('-time', 0.0)
+
+    # stiffness-proportional damping only: under MultipleSupport the mass-proportional term
+    # acts on the absolute velocities, and damps the rigid-body motion of the frame
+    alphaM, betaK = Transient.rayleigh()
+    ops.rayleigh(0.0, 0.0, 0.0, betaK)
+
+    if excitation == 'UniformExcitation':
+        Transient.uniform_excitation(fileName, GMScale)
+        constraints = model['constraints']
+    else:
+        Transient.multiple_support({nodeTag: fileName for nodeTag in model['baseNodes']}, GMScale)
+        constraints = 'Transformation'
+    # both analyses end at the last value of the record
+    dt, accel = Transient.read_record(fileName)
+    peaks = Transient.analyze(model, (len(accel) - 1)*dt, dt/numSubSteps, None, constraints)
+    ops.wipe()
+
+    return [peaks['maxRoofDisp']] + peaks['maxDrift'] + [peaks['maxBaseShear']]
+
+
+records = GroundMotion.record_files(GMDir) if os.path.exists(GMDir) else []
+if not records:
+    print('no record in %s' % GMDir)
+    sys.exit(1)
+
+uniform = run('UniformExcitation', records[0])
+multiple = run('MultipleSupport', records[0])
+
+names = ['max roof disp [%s]' % unit.LunitTXT] + ['max drift story %d' % (story + 1) for story in
+                                                range(len(uniform) - 2)] + ['max base shear [%s]' % unit.FunitTXT]
+
+print(os.path.basename(records[0]))
+print('%-24s %18s %16s %10s' % ('', 'UniformExcitation', 'MultipleSupport', 'diff [%]'))
+worst = 0.
+for name, valueUniform, valueMultiple in zip(names, uniform, multiple):
+    diff = valueMultiple/valueUniform - 1.
+    worst = max(worst, abs(diff))
+    print('%-24s %18.4f %16.4f %10.2f' % (name, valueUniform, valueMultiple, diff*100))
+
+if worst > tolerance:
+    sys.exit(1)
@@ -0,0 +1,89 @@
+# -----------------------------------------------------------------------------
+# Example 5. 2D Frame --  Dynamic Ground-Motion Analysis
+# nonlinearBeamColumn element, inelastic fiber section -- Steel W-Section
+#
+#     This file provided by (c) Farshad Rasuli, 2021-2022.
+#
+# E-Mail: <farshad.rasuli@gmail.com>
+# <github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205/>
+# <farshadrasuli.github.io/OpenSeesPy/>
+# -----------------------------------------------------------------------------
+
+# import other modules
+import os
+import csv
+import datetime
+import time
+# import auxiliary *.py files
+import GroundMotion as GroundMotion
+
+
+
+
+
+
+
+
+
+
+# Set up ======================================================================
+
+
+# define a name for model
+modelName = 'Ex5-2D-Frame-Fiber-Wsection'
+
+# set up name of output data directory
+outDir = modelName + '_Output'
+# create data directory
+if not os.path.exists(outDir):
+    os.makedirs(outDir)
+
+# ground-motion file directory, PEER NGA records (*.AT2)
+GMDir = modelName + '_Ground-motions'
+# create directory
+if not os.path.exists(GMDir):
+    os.makedirs(GMDir)
+
+# ground-motion scale factor
+GMScale = 1.0
+
+# number of worker processes (None: all cores)
+numProcess = None
+
+# run gravity once and fork the converged gravity state into every record (where fork is available)
+reuseGravity = True
+
+
+
+
+
+
+
+
+
+
+# Ground-motion analyses ======================================================
+
+# the guard is required by the process pool on platforms that spawn workers
+if __name__ == '__main__':
+
+    numRecord = len(GroundMotion.record_files(GMDir))
+    print('\n*****' + modelName + '*****\n' + datetime.datetime.now().strftime('%H:%M:%S') + ': ' + str(numRecord) + ' ground-motion analyses started.')
+
+    tStart = time.perf_counter()
+    results = GroundMotion.run_records(GMDir, GMScale, numProcess, reuseGravity)
+    wallTime = time.perf_counter() - tStart
+
+    print(datetime.datetime.now().strftime('%H:%M:%S') + ': Ground-motion analyses finished in %.1f sec.' % wallTime)
+
+
+    # peak responses of each record
+    numStory = len(results[0]['maxDrift']) if results else 0
+    with open(outDir + '/GMPeakResponses.csv', 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['record', 'scale', 'converged', 'time', 'maxRoofDisp', 'maxRoofDrift', 'maxBaseShear']
+                        + ['maxDrift' + str(story + 1) for story in range(numStory)])
+        for result in results:
+            writer.writerow([result['record'], result['scale'], result['converged'], result['time'],
+                             result['maxRoofDisp'], result['maxRoofDrift'], result['maxBaseShear']]
+                            + result['maxDrift'])
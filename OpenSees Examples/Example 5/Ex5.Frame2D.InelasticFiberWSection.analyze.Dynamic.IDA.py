@@ -0,0 +1,104 @@
+# -----------------------------------------------------------------------------
+# Example 5. 2D Frame --  Incremental Dynamic Analysis (IDA)
+# nonlinearBeamColumn element, inelastic fiber section -- Steel W-Section
+#
+#     This file provided by (c) Farshad Rasuli, 2021-2022.
+#
+# E-Mail: <farshad.rasuli@gmail.com>
+# <github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205/>
+# <farshadrasuli.github.io/OpenSeesPy/>
+# -----------------------------------------------------------------------------
+
+# import other modules
+import os
+import datetime
+import time
+# import auxiliary *.py files
+import GroundMotion as GroundMotion
+import IDA as IDA
+
+
+
+
+
+
+
+
+
+
+# Set up ======================================================================
+
+
+# define a name for model
+modelName = 'Ex5-2D-Frame-Fiber-Wsection'
+
+# set up name of output data directory
+outDir = modelName + '_Output'
+# create data directory
+if not os.path.exists(outDir):
+    os.makedirs(outDir)
+
+# ground-motion file directory, PEER NGA records (*.AT2)
+GMDir = modelName + '_Ground-motions'
+# create directory
+if not os.path.exists(GMDir):
+    os.makedirs(GMDir)
+
+# number of worker processes (None: all cores)
+numProcess = None
+
+# run gravity once and fork the converged gravity state into every run (where fork is available)
+reuseGravity = True
+
+
+
+
+
+
+
+
+
+
+# Hunt & fill parameters ======================================================
+
+# intensity measure: PGA (g)
+firstIM = 0.1           # intensity of the first run
+stepIM = 0.1            # first step of the hunt
+incrStepIM = 0.05       # increase of the step of the hunt after every run
+resolution = 0.02       # resolution of the collapse capacity and of the fill
+maxRuns = 12            # runs per record
+
+# collapse: peak interstory drift ratio beyond collapseDrift, or non-convergence
+collapseDrift = 0.10
+
+
+
+
+
+
+
+
+
+
+# Incremental dynamic analysis ================================================
+
+# the guard is required by the process pool on platforms that spawn workers
+if __name__ == '__main__':
+
+    numRecord = len(GroundMotion.record_files(GMDir))
+    print('\n*****' + modelName + '*****\n' + datetime.datetime.now().strftime('%H:%M:%S') + ': IDA of '
+          + str(numRecord) + ' ground motions started, at most ' + str(numRecord*maxRuns) + ' analyses.')
+
+    # the peak interstory drift of every run is written to IDAResults.csv as soon as the run finishes
+    tStart = time.perf_counter()
+    rows = IDA.run(GMDir, outDir + '/IDAResults.csv', collapseDrift, firstIM, stepIM, incrStepIM, resolution,
+                   maxRuns, numProcess, reuseGravity)
+    wallTime = time.perf_counter() - tStart
+
+    print(datetime.datetime.now().strftime('%H:%M:%S') + ': IDA finished, %d analyses in %.1f sec.'
+          % (len(rows), wallTime))
+
+
+    # collapse capacity of each record
+    for record, IM in IDA.collapse_capacity(rows).items():
+        print('%-32s collapse capacity PGA = %.3f g' % (record, IM))
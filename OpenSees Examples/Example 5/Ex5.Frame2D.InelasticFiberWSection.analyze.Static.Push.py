@@ -11,16 +11,21 @@
 
 # import the OpenSeesPy module
 import openseespy.opensees as ops
-import openseespy.postprocessing.Get_Rendering as opsplt
-import openseespy.postprocessing.ops_vis as opsv
 # import other modules
 import os
 import datetime
-import math
-import matplotlib.pyplot as plt
+import numpy as np
 # import auxiliary *.py files
 import LibUnits as unit
-import Wsection as Wsection
+import Frame2D as Frame2D
+import StreamRecorder as StreamRecorder
+import Pushover as Pushover
+import Modal as Modal
+import Render as Render
+import Checkpoint as Checkpoint
+import Profiler as Profiler
+import Capacity as Capacity
+import Solver as Solver
 
 
 
@@ -38,20 +43,38 @@ import Wsection as Wsection
 modelName = 'Ex5-2D-Frame-Fiber-Wsection'
 
 
-# remove existing model
-ops.wipe()
-
-
-# modelbuilder
-ops.model('basic', '-ndm', 2, '-ndf', 3)
-
-
 # set up name of output data directory
 outDir = modelName + '_Output'
 # create data directory
 if not os.path.exists(outDir):
     os.makedirs(outDir)
 
+# recorder output format: '-binary' (memory-mapped by Recorders.load) or '-file' (text)
+recFormat = '-binary'
+recExt = '.bin' if recFormat == '-binary' else '.out'
+
+# render the sections, the model, its modes (and the capacity curve) after the analysis, in a background
+# process, from the results saved in outDir/model.npz (see Render.py); the analysis never imports matplotlib
+render = True
+
+# write the recorders to disk; with False only the in-memory stream of the push-over is kept
+recordToFile = True
+
+# checkpoint/restart of the push-over: a checkpoint is written to ckDir every ckEvery converged steps, and
+# a run of the same model started while a checkpoint exists continues from it (resume = False starts over);
+# the resumed run repeats gravity and replays the push-over to the checkpoint in coarse steps (see Checkpoint.py)
+ckDir = outDir + '/checkpoint'
+ckEvery = 100
+resume = True
+
+# per-step telemetry of the gravity and push-over analyses: wall time, iterations, norm, algorithm, fallback
+profiler = Profiler.Profiler()
+stepLogFile = outDir + '/stepLog.csv'     # '.parquet' requires pyarrow
+
+# select the system of equations and the numberer by the size of the model, from the table of Solver.py
+# (see Ex5.Benchmark.Solver.py); False: RCM and BandGen
+autoSolver = False
+
 # ground-motion file directory
 GMDir = modelName + '_Ground-motions'
 # create directory
@@ -71,206 +94,74 @@ if not os.path.exists(GMDir):
 
 
 # define structure-geometry paramters
-colHeight = 14*unit.ft	# column height
-beamLength = 24*unit.ft	# beam length
-
-
-# calculate locations of beam/column intersections:
-X1 = 0.
-X2 = X1 + beamLength
-X3 = X2 + beamLength
-X4 = X3 + beamLength
-Y1 = 0.
-Y2 = Y1 + colHeight
-Y3 = Y2 + colHeight
-Y4 = Y3 + colHeight
-
-
-# create nodes ································································
-#         nodeTag,  X,  Y
-ops.node(      11, X1, Y1)
-ops.node(      12, X2, Y1)
-ops.node(      13, X3, Y1)
-ops.node(      14, X4, Y1)
-ops.node(      21, X1, Y2)
-ops.node(      22, X2, Y2)
-ops.node(      23, X3, Y2)
-ops.node(      24, X4, Y2)
-ops.node(      31, X1, Y3)
-ops.node(      32, X2, Y3)
-ops.node(      33, X3, Y3)
-ops.node(      34, X4, Y3)
-ops.node(      41, X1, Y4)
-ops.node(      42, X2, Y4)
-ops.node(      43, X3, Y4)
-ops.node(      44, X4, Y4)
-
-
-# Set up parameters that are particular to the model for displacement control ·
-tagCtrlNode = 41		# node where displacement is read for displacement control
-tagCtrlDOF = 1	     	# degree of freedom of displacement read for displacement control
 numStory = 3	       	# number of stories above ground level
 numBay = 3	         	# number of bays
-buildingHeight = Y4		# total building height
-
-
-# set boundary condition ······················································
-#        nodeTag, X, Y, RZ
-ops.fix(      11, 1, 1,  0)
-ops.fix(      12, 1, 1,  0)
-ops.fix(      13, 1, 1,  0)
-ops.fix(      14, 1, 1,  0)
+colHeight = 14*unit.ft	# column height
+beamLength = 24*unit.ft	# beam length
 
 
 # define materials ····························································
 
 # Hardening Material
-matHardening = 1
 Es = 29000*unit.ksi		# tangent stiffness
 Fy = 60.0*unit.ksi      # yield stress or force
-nu = 0.3                # Poisson's ratio
-Gs = Es/(2*(1+nu))      # Torsional stiffness Modulus
-H_iso = 0.0             # isotropic hardening Modulus
 H_kin = 1.e3            # kinematic hardening Modulus
-eta = 0.                # visco-plastic coefficient
-#                           Type,       matTag,  E, sigmaY, H_iso, H_kin, eta
-ops.uniaxialMaterial("Hardening", matHardening, Es,     Fy, H_iso, H_kin, eta)
 
 
 # define sections ·····························································
 
-# sections: W27x114
 secW27_114 = 1          # assign a tag number to the column section tag
-secTitle = 'W27x114'    # assign a name to section
-d = 27.29*unit.inch 	# depth
-bf = 10.07*unit.inch	# flange width
-tf = 0.93*unit.inch 	# flange thickness
-tw = 0.57*unit.inch 	# web thickness
-nfdw = 16		# number of fibers along dw
-nftw = 2		# number of fibers along tw
-nfbf = 16		# number of fibers along bf
-nftf = 4		# number of fibers along tf
-#                    secTag, secTitle,       matTag, d, bf, tf, tw, nfdw, nftw, nfbf, nftf
-Wsection.section(secW27_114, secTitle, matHardening, d, bf, tf, tw, nfdw, nftw, nfbf, nftf)
-
-# sections: W24x94
 secW24_94 = 4           # assign a tag number to the beam section tag
-secTitle = 'W24x94'     # assign a name to section
-d = 24.31*unit.inch     # depth
-bf = 9.065*unit.inch	# flange width
-tf = 0.875*unit.inch	# flange thickness
-tw = 0.515*unit.inch	# web thickness
+# W-shapes by designation, dimensions and weight are taken from the database Wshapes.csv
+#    secTag: designation        (or [secTitle, d, bf, tf, tw, weight per length])
+sections = {
+secW27_114: 'W27x114',
+ secW24_94: 'W24x94',
+           }
 nfdw = 16		# number of fibers along dw
 nftw = 2		# number of fibers along tw
 nfbf = 16		# number of fibers along bf
 nftf = 4		# number of fibers along tf
-#                   secTag, secTitle,       matTag, d, bf, tf, tw, nfdw, nftw, nfbf, nftf
-Wsection.section(secW24_94, secTitle, matHardening, d, bf, tf, tw, nfdw, nftw, nfbf, nftf)
-
-
-# set up geometric transformations of element ·································
-colTransf = 1
-beamTransf = 2
-#              transfType,  transfTag
-ops.geomTransf(  'Linear',  colTransf) # set P-Delta in case of P-Delta analysis for columns
-ops.geomTransf(  'Linear', beamTransf)
 
 
 # define elements ·····························································
 
 numIntgrPts = 5	# number of Gauss integration points for nonlinear curvature distribution---np=2 for linear distribution ok
 
-# columns
-# level 1-2               eleType, eleTag, iNode, jNode, numIntgrPts,     secTag, transfTag
-ops.element('nonlinearBeamColumn',    111,    11,    21, numIntgrPts, secW27_114, colTransf)
-ops.element('nonlinearBeamColumn',    112,    12,    22, numIntgrPts, secW27_114, colTransf)
-ops.element('nonlinearBeamColumn',    113,    13,    23, numIntgrPts, secW27_114, colTransf)
-ops.element('nonlinearBeamColumn',    114,    14,    24, numIntgrPts, secW27_114, colTransf)
-# level 2-3               eleType, eleTag, iNode, jNode, numIntgrPts,     secTag, transfTag
-ops.element('nonlinearBeamColumn',    121,    21,    31, numIntgrPts, secW27_114, colTransf)
-ops.element('nonlinearBeamColumn',    122,    22,    32, numIntgrPts, secW27_114, colTransf)
-ops.element('nonlinearBeamColumn',    123,    23,    33, numIntgrPts, secW27_114, colTransf)
-ops.element('nonlinearBeamColumn',    124,    24,    34, numIntgrPts, secW27_114, colTransf)
-# level 3-4               eleType, eleTag, iNode, jNode, numIntgrPts,     secTag, transfTag
-ops.element('nonlinearBeamColumn',    131,    31,    41, numIntgrPts, secW27_114, colTransf)
-ops.element('nonlinearBeamColumn',    132,    32,    42, numIntgrPts, secW27_114, colTransf)
-ops.element('nonlinearBeamColumn',    133,    33,    43, numIntgrPts, secW27_114, colTransf)
-ops.element('nonlinearBeamColumn',    134,    34,    44, numIntgrPts, secW27_114, colTransf)
-
-# beams
-# level 2                 eleType, eleTag, iNode, jNode, numIntgrPts,     secTag, transfTag
-ops.element('nonlinearBeamColumn',    221,    21,    22, numIntgrPts,  secW24_94, beamTransf)
-ops.element('nonlinearBeamColumn',    222,    22,    23, numIntgrPts,  secW24_94, beamTransf)
-ops.element('nonlinearBeamColumn',    223,    23,    24, numIntgrPts,  secW24_94, beamTransf)
-# level 3                 eleType, eleTag, iNode, jNode, numIntgrPts,     secTag, transfTag
-ops.element('nonlinearBeamColumn',    231,    31,    32, numIntgrPts,  secW24_94, beamTransf)
-ops.element('nonlinearBeamColumn',    232,    32,    33, numIntgrPts,  secW24_94, beamTransf)
-ops.element('nonlinearBeamColumn',    233,    33,    34, numIntgrPts,  secW24_94, beamTransf)
-# level 4                 eleType, eleTag, iNode, jNode, numIntgrPts,     secTag, transfTag
-ops.element('nonlinearBeamColumn',    241,    41,    42, numIntgrPts,  secW24_94, beamTransf)
-ops.element('nonlinearBeamColumn',    242,    42,    43, numIntgrPts,  secW24_94, beamTransf)
-ops.element('nonlinearBeamColumn',    243,    43,    44, numIntgrPts,  secW24_94, beamTransf)
-
-
-
+# element formulation: 'nonlinearBeamColumn', 'forceBeamColumn' (plastic hinges, HingeRadau) or 'dispBeamColumn'
+eleType = 'nonlinearBeamColumn'
+hingeLength = 1.0	# plastic hinge length of forceBeamColumn, in section depths
 
+# geometric transformation: 'Linear', 'PDelta' (P-Delta analysis) or 'Corotational' (large displacements)
+colTransfType = 'Linear'	# columns
+beamTransfType = 'Linear'	# beams
 
 
+# define constraints ··························································
 
+diaphragm = False	# rigid floor diaphragm: equalDOF of the floor nodes in X (e.g. 22-24 to 21), fewer equations
 
 
+# build the frame: nodes, boundary conditions, material, sections, elements and masses ·
+# (see Frame2D.py for the node and element numbering, e.g. nodes 11-44, columns 111-134, beams 221-243)
+model = Frame2D.build(numStory, numBay, colHeight, beamLength,
+                      sections, secW27_114, secW24_94,
+                      Fy, Es, H_kin, numIntgrPts,
+                      nfdw, nftw, nfbf, nftf, diaphragm,
+                      colTransfType, beamTransfType,
+                      eleType, hingeLength)
 
-# Gravity Loads, weight, and masses ===========================================
 
-# calculate dead load of frame, assume this to be an internal frame
-    # calculate distributed weight along the beam length
-gammaConcrete = 150*unit.pcf    	# Reinforced-Concrete floor slabs
-tSlab = 6*unit.inch	    	       	# 6-inch slab
-lSlab= 2*beamLength/2  		    	# assume slab extends a distance of 1/2beamLength in/out of plane
-slabWeight = gammaConcrete*tSlab*lSlab 
-beamWeight = 94*unit.lbf/unit.ft	# W-section weight per length
-beamDl = slabWeight + beamWeight  	# dead load distributed along beam.
-colWeight = 114*unit.lbf/unit.ft   	# W-section weight per length
-
-totColWeight = colWeight*colHeight 	# total Column weight
-totBeamWeight = beamDl*beamLength  	# total Beam weight
-
-
-# assign masses to the nodes that the columns are connected to
-
-# each connection takes the mass of 1/2 of each element framing into it (mass=weight/$g)
-# level 2
-ops.mass(21, (totColWeight/2 + totColWeight/2 +totBeamWeight/2)/unit.g, 0., 0.)
-ops.mass(22, (totColWeight/2 + totColWeight/2 +totBeamWeight/2 +totBeamWeight/2)/unit.g, 0., 0.)
-ops.mass(23, (totColWeight/2 + totColWeight/2 +totBeamWeight/2 +totBeamWeight/2)/unit.g, 0., 0.)
-ops.mass(24, (totColWeight/2 + totColWeight/2 +totBeamWeight/2)/unit.g, 0., 0.)
-# level 3
-ops.mass(31, (totColWeight/2 + totColWeight/2 +totBeamWeight/2)/unit.g, 0., 0.)
-ops.mass(32, (totColWeight/2 + totColWeight/2 +totBeamWeight/2 +totBeamWeight/2)/unit.g, 0., 0.)
-ops.mass(33, (totColWeight/2 + totColWeight/2 +totBeamWeight/2 +totBeamWeight/2)/unit.g, 0., 0.)
-ops.mass(34, (totColWeight/2 + totColWeight/2 +totBeamWeight/2)/unit.g, 0., 0.)
-# level 4
-ops.mass(41, (totColWeight/2 +totBeamWeight/2)/unit.g, 0., 0.)
-ops.mass(42, (totColWeight/2 +totBeamWeight/2 +totBeamWeight/2)/unit.g, 0., 0.)
-ops.mass(43, (totColWeight/2 +totBeamWeight/2 +totBeamWeight/2)/unit.g, 0., 0.)
-ops.mass(44, (totColWeight/2 +totBeamWeight/2)/unit.g, 0., 0.)
-
-
-# calculate total Floor Mass
-
-# weight of each level
-floorWeight2 = totColWeight*4/2 +totColWeight*4/2 +3*totBeamWeight
-floorWeight3 = totColWeight*4/2 +totColWeight*4/2 +3*totBeamWeight
-floorWeight4 = totColWeight*4/2 +3*totBeamWeight
-# total frame weight
-totalWeight = floorWeight2 + floorWeight3 + floorWeight4
+# Set up parameters that are particular to the model for displacement control ·
+tagCtrlNode = model['tagCtrlNode']		# node where displacement is read for displacement control
+tagCtrlDOF = model['tagCtrlDOF']		# degree of freedom of displacement read for displacement control
+buildingHeight = model['buildingHeight']	# total building height
+matHardening = model['matHardening']		# material tag of the fibers
+baseNodes = model['baseNodes']			# support nodes
+eleRec = model['columns'][(1, 1)]		# element recorded below: first-story column, left pier
 
-# mass of each level
-floorMass2 = floorWeight2/unit.g
-floorMass3 = floorWeight3/unit.g
-floorMass4 = floorWeight4/unit.g
-# total frame mass
-totalMass = floorMass2 + floorMass3 + floorMass4
+# last checkpoint of this model, if any
+checkpoint = Checkpoint.load(ckDir, model['key']) if resume else None
 
 
 
@@ -296,21 +187,16 @@ totalMass = floorMass2 + floorMass3 + floorMass4
 
 # Eigen value analysis ========================================================
 
-#                                       solver, numEigenvalues
-squareEigenValues = ops.eigen('-fullGenLapack',     numStory*3)
-
+# solver is picked by model size (dense fullGenLapack for small models, genBandArpack otherwise),
+# and the results are cached in outDir by a hash of the model, so an unchanged model skips eigen
+modal = Modal.eigen(numStory*3, cacheDir=outDir)
 
 # eigen values for each mode
-eigenValues = [None] * len(squareEigenValues)
-for i in range(len(squareEigenValues)):
-    eigenValues[i] = math.sqrt(squareEigenValues[i]) # rad/sec
-
+squareEigenValues = modal['eigenValues']
+eigenValues = modal['omega'] # rad/sec
 
 # period for each mode
-T = [None] * len(eigenValues)
-for i in range(len(eigenValues)):
-    T[i] = 2.0 * math.pi / eigenValues[i] # sec
-
+T = modal['period'] # sec
 
 
 
@@ -320,17 +206,6 @@ for i in range(len(eigenValues)):
 
 
 
-# Create output database and render the model =================================
-
-# create output database for Modal loadcase
-opsplt.createODB(modelName, 'Gravity', Nmodes=3)
-
-# render th model
-opsplt.plot_model('nodes', 'elements', Model=modelName)
-
-# plot mode shape 1 with period
-opsplt.plot_modeshape(1, 100, Model=modelName)
-
 
 print('\n*****' + modelName + '*****\n' + datetime.datetime.now().strftime('%H:%M:%S') + ': Model built successfully.')
 
@@ -358,35 +233,38 @@ print('\n*****' + modelName + '*****\n' + datetime.datetime.now().strftime('%H:%
 
 # Set recorders ==============================================================
 
-# displacements of free node
-ops.recorder('Node','-file', outDir+'/freeNodeDisp.out', '-time', '-node', 41, '-dof', 1, 2, 3, 'disp')
+if recordToFile:
+
+    # displacements of free node
+    ops.recorder('Node',recFormat, outDir+'/freeNodeDisp'+recExt, '-time', '-node', tagCtrlNode, '-dof', 1, 2, 3, 'disp')
 
-# displacements of support nodes
-ops.recorder('Node','-file', outDir+'/baseDisp.out', '-time', '-node', 11, 12, 13, 14, '-dof', 1, 2, 3, 'disp')
+    # displacements of support nodes
+    ops.recorder('Node',recFormat, outDir+'/baseDisp'+recExt, '-time', '-node', *baseNodes, '-dof', 1, 2, 3, 'disp')
 
-# support reaction
-ops.recorder('Node','-file', outDir+'/baseReaction.out', '-time', '-node', 11, 12, 13, 14, '-dof', 1, 2, 3, 'reaction')
+    # support reaction
+    ops.recorder('Node',recFormat, outDir+'/baseReaction'+recExt, '-time', '-node', *baseNodes, '-dof', 1, 2, 3, 'reaction')
 
-# lateral drift
-#ops.recorder('Drift','-file', outDir+'/DrNode.out', '-time', '-iNode', 11, '-jNode', 41, '-dof', 1, '-perpDirn', 2)
+    # lateral drift
+    #ops.recorder('Drift',recFormat, outDir+'/DrNode'+recExt, '-time', '-iNode', baseNodes[0], '-jNode', tagCtrlNode, '-dof', 1, '-perpDirn', 2)
 
-# forces in local coordinates, element i
-ops.recorder('Element','-file', outDir+'/ele111Forces.out', '-time', '-ele', 111, 'localForce')
+    # forces in local coordinates, element i
+    ops.recorder('Element',recFormat, outDir+'/ele111Forces'+recExt, '-time', '-ele', eleRec, 'localForce')
 
-# section forces, axial and moment, node i
-ops.recorder('Element','-file', outDir+'/ele111Sec1Force.out', '-time', '-ele', 111, 'section', 1, 'force')
+    # section forces, axial and moment, node i
+    ops.recorder('Element',recFormat, outDir+'/ele111Sec1Force'+recExt, '-time', '-ele', eleRec, 'section', 1, 'force')
 
-# section deformations, axial and curvature, node i
-ops.recorder('Element','-file', outDir+'/ele111Sec1Defo.out', '-time', '-ele', 111, 'section', 1, 'deformation')
+    # section deformations, axial and curvature, node i
+    ops.recorder('Element',recFormat, outDir+'/ele111Sec1Defo'+recExt, '-time', '-ele', eleRec, 'section', 1, 'deformation')
 
-# section forces, axial and moment, node j
-ops.recorder('Element','-file', outDir+'/ele111Sec'+str(numIntgrPts)+'Force.out', '-time', '-ele', 111, 'section', numIntgrPts, 'force')
+    # section forces, axial and moment, node j
+    ops.recorder('Element',recFormat, outDir+'/ele111Sec'+str(numIntgrPts)+'Force'+recExt, '-time', '-ele', eleRec, 'section', numIntgrPts, 'force')
 
-# section deformations, axial and curvature, node j
-ops.recorder('Element','-file', outDir+'/ele111Sec'+str(numIntgrPts)+'Defo.out', '-time', '-ele', 111, 'section', numIntgrPts, 'deformation')
+    # section deformations, axial and curvature, node j
+    ops.recorder('Element',recFormat, outDir+'/ele111Sec'+str(numIntgrPts)+'Defo'+recExt, '-time', '-ele', eleRec, 'section', numIntgrPts, 'deformation')
 
-# steel fiber stress-strain, node i
-ops.recorder('Element','-file', outDir+'/ele1sec1StressStrain.out', '-time', '-ele', 111, 'section', numIntgrPts, 'fiber', 0, 0, matHardening, 'stressStrain')
+    # steel fiber stress-strain, node i
+    ops.recorder('Element',recFormat, outDir+'/ele1sec1StressStrain'+recExt, '-time', '-ele', eleRec, 'section', numIntgrPts, 'fiber', 0, 0, matHardening, 'stressStrain')
+# end if
 
 
 
@@ -400,27 +278,20 @@ ops.recorder('Element','-file', outDir+'/ele1sec1StressStrain.out', '-time', '-e
 # Gravitational loading =======================================================
 
 
-# set time series ·····························································
+# set time series ·························································
 #                tsType, tag, '-factor', factor=1.0, '-tStart', tStart=0.0
 ops.timeSeries('Linear',   1)
 
 
-# set load pattern ····························································
+# set load pattern ························································
 #            patternType, patternTag, tsTag, '-fact', factor
 ops.pattern(     'Plain',          1,     1)
 
 
-# define gravity loads ························································
+# define gravity loads ····················································
 
-# beams (in -ydirection)
-ops.eleLoad('-ele', 221, 222, 223, '-type', '-beamUniform', -beamDl)
-ops.eleLoad('-ele', 231, 232, 233, '-type', '-beamUniform', -beamDl) 
-ops.eleLoad('-ele', 241, 242, 243, '-type', '-beamUniform', -beamDl)
-
-# columns (in -xdirection)
-ops.eleLoad('-ele', 111, 112, 113, 114, '-type', '-beamUniform', 0, -colWeight)
-ops.eleLoad('-ele', 121, 122, 123, 124, '-type', '-beamUniform', 0, -colWeight) 
-ops.eleLoad('-ele', 131, 132, 133, 134, '-type', '-beamUniform', 0, -colWeight) 
+# beams (in -ydirection) and columns (in -xdirection)
+Frame2D.gravity_loads(model)
 
 
 
@@ -437,14 +308,19 @@ ops.eleLoad('-ele', 131, 132, 133, 134, '-type', '-beamUniform', 0, -colWeight)
 print(datetime.datetime.now().strftime('%H:%M:%S') + ': Gravity analysis started.')
 
 
-# set constraint---how it handles boundary conditions
-ops.constraints('Plain') # large model with rigid diaphragm try Transformation
+if autoSolver:
+    # the fastest benchmarked combination for the number of free DOFs, with the constraint handler of the model
+    print('Solver: system %s, numberer %s, constraints %s' % Solver.auto(constraints=model['constraints']))
+else:
+    # set constraint---how it handles boundary conditions
+    ops.constraints(model['constraints']) # 'Plain', or 'Transformation' with rigid diaphragm
 
-# set numberer---renumber dof's to minimize band-width (optimization), if you want to
-ops.numberer('RCM')
+    # set numberer---renumber dof's to minimize band-width (optimization), if you want to
+    ops.numberer('RCM')
 
-# set the system of equation---how to store and solve the system of equations in the analysis (large model: try UmfPack)
-ops.system('BandGen')
+    # set the system of equation---how to store and solve the system of equations in the analysis (large model: try UmfPack)
+    ops.system('BandGen')
+# end if
 
 # convergence tolerance for test
 tolGravity = 1.0e-8
@@ -469,7 +345,7 @@ ops.integrator('LoadControl', gravityIncr)
 ops.analysis('Static')
 
 # perform analysis---apply gravity
-gravity = ops.analyze(numStepsGravity)
+gravity = profiler.analyze(numStepsGravity, stage='gravity', algorithm='Newton')
 
 
 # Set the gravity loads to be constant & reset the time in the domain
@@ -514,23 +390,17 @@ incrDisp = 1.e-4*buildingHeight
 
 
 
-# LATERAL-LOAD distribution for static pushover analysis ======================
+# Static push-over loading ====================================================
 
-# calculate distribution of lateral load based on mass/weight distributions along building height
-# Fj = ( WjHj/sum(WiHi) ) * totalWeight   at each floor j
 
-sumWiHi = floorWeight2*Y2 + floorWeight3*Y3 + floorWeight4*Y4 # denominator
+# set load pattern and define load pattern ····································
 
-Fj2 = (floorWeight2*Y2/sumWiHi)*totalWeight # total for floor 2
-Fj3 = (floorWeight3*Y3/sumWiHi)*totalWeight # total for floor 3
-Fj4 = (floorWeight4*Y4/sumWiHi)*totalWeight # total for floor 4
+# distribution of lateral load based on mass/weight distributions along building height
+# Fj = ( WjHj/sum(WiHi) ) * totalWeight   at each floor j, shared equally by the nodes of the floor
+#                          patternTag, tsTag
+Frame2D.lateral_loads(model,        2,     1)
 
-# per node at each floor j
-Fi2 = Fj2/4		       	# per node on floor 2
-Fi3 = Fj3/4	    		# per node on floor 3
-Fi4 = Fj4/4	    		# per node on floor 4
 
-iFi = [Fi2, Fi3, Fi4]   # vectorize
 
 
 
@@ -539,96 +409,115 @@ iFi = [Fi2, Fi3, Fi4]   # vectorize
 
 
 
+# Push-over analysis parameters ===============================================
 
 
-# Static push-over loading ====================================================
+print(datetime.datetime.now().strftime('%H:%M:%S') + ': Push-over analysis started.')
 
 
-# set load pattern ····························································
-#            patternType, patternTag, tsTag, '-fact', factor
-ops.pattern(     'Plain',          2,     1)
 
+# convergence tolerance for test
+tolPush = 1.0e-8
+
+# set maximum number of iterations that will be performed before "failure to converge" is returned
+maxNumIterPush = 6
+
+# set the convergence test of equations
+ops.test('EnergyIncr', tolPush, maxNumIterPush)
+
+# set algorithm
+ops.algorithm('Newton')
 
-# define load pattern ·························································
+# set integrator
+ops.integrator('DisplacementControl', tagCtrlNode, tagCtrlDOF, incrDisp)
 
-for level in range(2,numStory+1+1):
-    Fi = iFi[level-1-1]
-    for pier in range(1,numBay+1+1):
-        nodeTag = level*10 + pier
-        ops.load(nodeTag, Fi, 0.0, 0.0)
-    # end for pier
-# end for level
+# set analysis
+ops.analysis('Static')
 
+# in-memory recorder of the capacity curve, a row per step: time, roof displacement, sum of base reactions;
+# a block of rows is streamed every ckEvery steps, when a checkpoint is written
+streamRec = StreamRecorder.StreamRecorder([('disp', [tagCtrlNode], tagCtrlDOF), ('reaction', baseNodes, 1)],
+                                          bufferSize=ckEvery)
+pushCurve = []
+numStepsPush = 0
 
+if checkpoint is not None:
+    # push the model back to the checkpoint and continue its capacity curve
+    if Checkpoint.replay(checkpoint, tagCtrlNode, tagCtrlDOF, incrDisp, tolPush, maxNumIterPush) == 0:
+        # the recorder files hold the replay steps, not the steps before the checkpoint; the complete capacity
+        # curve is pushCurve (saved in outDir/model.npz)
+        print(datetime.datetime.now().strftime('%H:%M:%S') + ': Push-over replayed to step %d; the recorder files '
+              'start from the replay.' % checkpoint['step'])
+        pushCurve.append(checkpoint['pushCurve'])
+        numStepsPush = checkpoint['step']
+    else:
+        # the replay did not reproduce the checkpoint: back to the gravity-loaded model, and the whole push-over
+        # without the checkpoint; the recorder files hold the replay steps before those of the push-over
+        print(datetime.datetime.now().strftime('%H:%M:%S') + ': Replay to step %d failed, starting over.'
+              % checkpoint['step'])
+        Checkpoint.remove(ckDir)
+        Checkpoint.start_over(tolGravity, maxNumIterGravity)
 
+# perform analysis with the adaptive step-size controller: on failure the increment is cut back and
+# the other algorithms (Newton with Initial Tangent, Broyden, Newton with Line Search) are tried, the
+# increment grows back after consecutive converged steps (see Pushover.py)
+pushStats = {}
+pushSteps = Pushover.adaptive_steps(tagCtrlNode, tagCtrlDOF, maxDisp, incrDisp, tolPush, maxNumIterPush, pushStats,
+                                    profiler=profiler)
 
+# the rows are streamed in blocks while stepping
+for block in streamRec.record(pushSteps):
+    pushCurve.append(block.copy())
+    numStepsPush += len(block)
+    if len(block) == ckEvery:
+        Checkpoint.save(ckDir, numStepsPush, model['key'], pushCurve=np.concatenate(pushCurve))
+push = streamRec.ok
 
+# the push-over is complete, the next run starts over
+if push == 0:
+    Checkpoint.remove(ckDir)
 
+if push != 0:
+    print(datetime.datetime.now().strftime('%H:%M:%S') + ': Failed to converge at roof displacement = %.2f %s.'
+          % (ops.nodeDisp(tagCtrlNode, tagCtrlDOF), unit.LunitTXT))
+print(Pushover.report(pushStats))
 
+# step log and where the time went
+profiler.save(stepLogFile)
+print(profiler.report())
 
 
+# capacity curve: roof displacement vs base shear
+pushCurve = np.concatenate(pushCurve)
+roofDisp = pushCurve[:, 1]
+baseShear = -pushCurve[:, 2]
 
-# Push-over analysis parameters ===============================================
+print(datetime.datetime.now().strftime('%H:%M:%S') + ': Push-over analysis finished. Maximum base shear = %.1f %s at roof displacement = %.2f %s.'
+      % (baseShear.max(), unit.FunitTXT, roofDisp[baseShear.argmax()], unit.LunitTXT))
 
+# bilinear idealization (ASCE 41): effective yield point, ultimate point and ductility
+# (the same curve can be loaded from the recorder files with Capacity.load)
+idealized = Capacity.bilinear(roofDisp, baseShear)
+print('Effective yield: Vy = %.1f %s at dy = %.2f %s; ultimate: Vu = %.1f %s at du = %.2f %s; ductility = %.2f.'
+      % (idealized['Vy'], unit.FunitTXT, idealized['dy'], unit.LunitTXT,
+         idealized['Vu'], unit.FunitTXT, idealized['du'], unit.LunitTXT, idealized['ductility']))
 
-print(datetime.datetime.now().strftime('%H:%M:%S') + ': Push-over analysis started.')
 
 
 
-# convergence tolerance for test
-tolPush = 1.0e-8
 
-# set maximum number of iterations that will be performed before "failure to converge" is returned
-maxNumIterPush = 6
 
-# set the convergence test of equations
-ops.test('EnergyIncr', tolPush, maxNumIterPush)
 
-# set algorithm
-ops.algorithm('Newton')
 
-# set integrator
-ops.integrator('DisplacementControl', tagCtrlNode, tagCtrlDOF, incrDisp)
 
-# set analysis
-ops.analysis('Static')
 
-# number of pushover analysis steps
-numStepsPush = int(maxDisp/incrDisp)
-
-# perform analysis
-push = ops.analyze(numStepsPush)
-
-# if analysis fails, we try some other stuff
-if push !=0:
-    print(datetime.datetime.now().strftime('%H:%M:%S') + ': Failed to converge.')
-    dStep = 0.
-    push = 0.
-    NormDispIncr = 2000
-    while dStep <= 1.0 and push == 0.0:
-        controlDisp = ops.nodeDisp(tagCtrlNode, tagCtrlDOF)
-        dStep = controlDisp/maxDisp
-        push = ops.analyze(1)
-        # if analysis fails, we try some other stuff
-        if push != 0:
-            print(datetime.datetime.now().strftime('%H:%M:%S') + ': Trying Newton with Initial Tangent.')
-            ops.test('NormDispIncr', tolPush, maxNumIterPush)
-            ops.algorithm('Newton', False, True)
-            push = ops.analyze(1)
-            ops.test('EnergyIncr', tolPush, maxNumIterPush)
-            ops.algorithm('Newton')
-        if push != 0:
-            print(datetime.datetime.now().strftime('%H:%M:%S') + ': Trying Broyden.')
-            ops.algorithm('Broyden', 8)
-            push = ops.analyze(1)
-            ops.algorithm('Newton')
-        if push != 0:
-            print(datetime.datetime.now().strftime('%H:%M:%S') + ': Trying Newton with Line Search.')
-            ops.algorithm('NewtonLineSearch', 0.8)
-            push = ops.analyze(1)
-            ops.algorithm('Newton')
-    # end while
-# end if
+# Post-processing =============================================================
+
+# save the model, its modes and the results in one file; the figures are rendered from it in a background
+# process, or later with: python Ex5.Frame2D.InelasticFiberWSection.render.py
+Render.save(outDir + '/model.npz', modal, pushCurve=pushCurve)
+if render:
+    Render.start(outDir + '/model.npz', outDir)
 
 
 
@@ -0,0 +1,105 @@
+# -----------------------------------------------------------------------------
+# Example 5. 2D Frame --  Parameter Sweep of the Static Pushover Analysis
+# nonlinearBeamColumn element, inelastic fiber section -- Steel W-Section
+#
+#     This file provided by (c) Farshad Rasuli, 2021-2022.
+#
+# E-Mail: <farshad.rasuli@gmail.com>
+# <github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205/>
+# <farshadrasuli.github.io/OpenSeesPy/>
+# -----------------------------------------------------------------------------
+
+# import other modules
+import os
+import datetime
+import time
+# import auxiliary *.py files
+import LibUnits as unit
+import Sweep as Sweep
+
+
+
+
+
+
+
+
+
+
+# Set up ======================================================================
+
+
+# define a name for model
+modelName = 'Ex5-2D-Frame-Fiber-Wsection'
+
+# set up name of output data directory
+outDir = modelName + '_Output'
+# create data directory
+if not os.path.exists(outDir):
+    os.makedirs(outDir)
+
+# result cache, a file per computed point; delete it to recompute every point
+cacheDir = outDir + '/sweep-cache'
+
+# results of the sweep, a column per parameter and per result ('.parquet' requires pyarrow)
+resultFile = outDir + '/SweepResults.npz'
+
+# number of worker processes (None: all cores)
+numProcess = None
+
+
+
+
+
+
+
+
+
+
+# Parameter grid ==============================================================
+
+# push-over to maxDrift of roof drift ratio, in increments of incrDrift
+maxDrift = 0.1
+incrDrift = 1.e-4
+
+# full grid of the parameters of Frame2D.build; points added later reuse the cached ones
+points = Sweep.grid(
+    Fy=[50*unit.ksi, 60*unit.ksi],
+    H_kin=[500., 1.e3],
+    colHeight=[12*unit.ft, 14*unit.ft],
+    beamLength=[24*unit.ft, 30*unit.ft],
+    numIntgrPts=[5],
+    )
+
+# or a Latin hypercube sample of the ranges
+#points = Sweep.latin_hypercube(16, seed=1, Fy=[50*unit.ksi, 70*unit.ksi], H_kin=[500., 2.e3],
+#                               colHeight=[12*unit.ft, 16*unit.ft], beamLength=[20*unit.ft, 30*unit.ft])
+
+
+
+
+
+
+
+
+
+
+# Sweep =======================================================================
+
+# the guard is required by the process pool on platforms that spawn workers
+if __name__ == '__main__':
+
+    print('\n*****' + modelName + '*****\n' + datetime.datetime.now().strftime('%H:%M:%S') + ': Sweep of '
+          + str(len(points)) + ' points started.')
+
+    tStart = time.perf_counter()
+    columns = Sweep.run(points, cacheDir, resultFile, maxDrift, incrDrift, numProcess=numProcess)
+    wallTime = time.perf_counter() - tStart
+
+    print(datetime.datetime.now().strftime('%H:%M:%S') + ': Sweep finished in %.1f sec.' % wallTime)
+
+    names = [name for name in columns if name not in Sweep.resultColumns]
+    print(' '.join('%12s' % name for name in names) + ' %16s %14s' % ('maxBaseShear', 'roofDriftAtMax'))
+    for i in range(len(points)):
+        print(' '.join('%12.4g' % columns[name][i] for name in names)
+              + ' %12.1f %3s %14.4f' % (columns['maxBaseShear'][i], unit.FunitTXT, columns['roofDriftAtMax'][i]))
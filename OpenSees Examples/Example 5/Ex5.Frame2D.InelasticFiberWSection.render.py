@@ -0,0 +1,58 @@
+# -----------------------------------------------------------------------------
+# Example 5. 2D Frame --  Post-processing: render the model and the results
+# nonlinearBeamColumn element, inelastic fiber section -- Steel W-Section
+#
+#     This file provided by (c) Farshad Rasuli, 2021-2022.
+#
+# E-Mail: <farshad.rasuli@gmail.com>
+# <github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205/>
+# <farshadrasuli.github.io/OpenSeesPy/>
+# -----------------------------------------------------------------------------
+
+# import other modules
+import sys
+import datetime
+# import auxiliary *.py files
+import Render as Render
+
+
+
+
+
+
+
+
+
+
+# Set up ======================================================================
+
+
+# define a name for model
+modelName = 'Ex5-2D-Frame-Fiber-Wsection'
+
+# set up name of output data directory
+outDir = modelName + '_Output'
+
+# results saved by the analysis (Render.save) and directory of the figures; the analysis scripts
+# start this stage in the background and pass both as arguments
+resultFile = sys.argv[1] if len(sys.argv) > 1 else outDir + '/model.npz'
+figDir = sys.argv[2] if len(sys.argv) > 2 else outDir
+
+# mode shapes to render, and largest displacement drawn
+modes = [1, 2, 3]
+scale = 48.          # inch
+
+
+
+
+
+
+
+
+
+
+# Render ======================================================================
+
+Render.render(resultFile, figDir, modes, scale)
+
+print(datetime.datetime.now().strftime('%H:%M:%S') + ': Figures of ' + resultFile + ' saved in ' + figDir + '.')
@@ -0,0 +1,44 @@
+# -----------------------------------------------------------------------------
+# ForkPool.py -- run analyses in child processes forked from a common state
+#       (c) Farshad Rasuli, 2021-2022
+#
+# E-Mail: farshad.rasuli@gmail.com
+# github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205
+# farshadrasuli.github.io/OpenSeesPy
+# -----------------------------------------------------------------------------
+'''
+run(func, argsList, numProcess) - call func(*args) for every args in argsList,
+        each call in its own child process forked from the current process,
+        and return the results in order
+pool(numProcess) - the multiprocessing.Pool of run, to submit the calls one by
+        one (apply_async), e.g. when the next call depends on a result
+available() - True if processes can be forked on this platform
+
+A forked child starts with a copy of the memory of its parent, including the
+OpenSees domain. Build the model and run the gravity analysis once, then call
+run: every analysis starts from the converged gravity state instead of
+repeating it, e.g. 100 ground motions cost one gravity analysis, not 100.
+
+Each worker of the pool runs a single call and is then replaced by a new fork
+of the parent (maxtasksperchild=1), so no call sees the domain left by another
+one. The parent must not change the domain while run is working. Forking is
+not available on Windows; the callers fall back to rebuilding the model in
+each worker there.
+'''
+
+import multiprocessing
+
+
+def available():
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+def pool(numProcess=None):
+    # numProcess=None uses all cores of the machine
+    return multiprocessing.get_context('fork').Pool(numProcess, maxtasksperchild=1)
+
+
+def run(func, argsList, numProcess=None):
+    argsList = list(argsList)
+    with pool(numProcess) as workers:
+        return workers.starmap(func, argsList, chunksize=1)
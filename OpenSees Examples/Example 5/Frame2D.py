@@ -0,0 +1,345 @@
+# -----------------------------------------------------------------------------
+# Frame2D.py -- build a 2D steel moment frame and apply the gravity loads
+#       (c) Farshad Rasuli, 2021-2022
+#
+# E-Mail: farshad.rasuli@gmail.com
+# github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205
+# farshadrasuli.github.io/OpenSeesPy
+#
+# Parametric form of the Example 5 frame, so a model can be rebuilt inside a
+# running process (e.g. a parameter sweep or a worker of a process pool).
+# -----------------------------------------------------------------------------
+'''
+define(numStory, numBay, colHeight, beamLength, ...) - the frame with
+        nonlinearBeamColumn (or, see eleTypes, forceBeamColumn with plastic
+        hinges or dispBeamColumn) elements and inelastic fiber W-sections, without
+        touching the domain: the model dictionary (parameters and tag map),
+        with the array-backed definition of Model.py in 'definition' and its
+        content hash in 'key'
+build(...) - define the frame and replay it into the (wiped) domain
+save(fileName, model) - save the model dictionary and its definition in a
+        single .npz file
+load(fileName) - replay a saved model into the domain and return its model
+        dictionary, with the key saved by save(); as slow as build(), which
+        only adds the define() step to the element constructors of OpenSees
+gravity_loads(model) - define the distributed gravity loads of beams and columns
+        in the current load pattern
+gravity(model) - apply the gravity loads with a load-controlled static analysis,
+        then set them constant and reset the time in the domain; with a
+        profiler (Profiler.py) every step is logged, stage 'gravity'
+lateral_loads(model) - define the load pattern of the static push-over analysis
+
+Tag numbering follows Example 5 (Figure 1):
+    node      = level, pier                  e.g. 11-44 for 3-story 3-bay
+    column    = 1, story (bottom level), pier  e.g. 111-134
+    beam      = 2, level, bay                e.g. 221-243
+where level, pier and bay take as many digits as the frame needs, so a
+20-story 10-bay frame numbers its nodes 101-2111.
+'''
+
+import json
+
+import numpy as np
+
+import openseespy.opensees as ops
+
+import LibUnits as unit
+import Wshapes as Wshapes
+import Model as Model
+
+
+# geometric transformations of the member groups
+transfTypes = ['Linear', 'PDelta', 'Corotational']
+
+# element formulations
+#   nonlinearBeamColumn  force-based, numIntgrPts Gauss-Lobatto points along the element (Example 5)
+#   forceBeamColumn      force-based, plastic hinges of hingeLength at the ends (HingeRadau), elastic in between
+#   dispBeamColumn       displacement-based, numIntgrPts Gauss-Legendre points
+eleTypes = ['nonlinearBeamColumn', 'forceBeamColumn', 'dispBeamColumn']
+
+# sections of Example 5
+#   secTag: W-shape designation, or [secTitle, d, bf, tf, tw, weight per length]
+sectionsEx5 = {
+    1: 'W27x114',
+    4: 'W24x94',
+    }
+
+
+def _section(section):
+    # [secTitle, d, bf, tf, tw, weight per length] of a section given by its W-shape designation or its dimensions
+    if isinstance(section, str):
+        W = Wshapes.shape(section)
+        return [section, W['d'], W['bf'], W['tf'], W['tw'], W['W']]
+    return section
+
+
+def _per_story(value, numStory):
+    # a single value applies to every story, a list gives one value per story
+    if isinstance(value, (list, tuple)):
+        if len(value) != numStory:
+            raise ValueError('expected %d values, one per story, got %d' % (numStory, len(value)))
+        return list(value)
+    return [value] * numStory
+
+
+def define(numStory=3, numBay=3, colHeight=14*unit.ft, beamLength=24*unit.ft,
+           sections=sectionsEx5, colSection=1, beamSection=4,
+           Fy=60.0*unit.ksi, Es=29000*unit.ksi, H_kin=1.e3, numIntgrPts=5,
+           nfdw=16, nftw=2, nfbf=16, nftf=4, diaphragm=False, colTransfType='Linear', beamTransfType='Linear',
+           eleType='nonlinearBeamColumn', hingeLength=1.0):
+    '''
+    numStory, numBay      - number of stories above ground level and of bays
+    colHeight, beamLength - column height and beam length
+    sections              - {secTag: W-shape designation (see Wshapes.py) or [secTitle, d, bf, tf, tw, weight per length]}
+    colSection            - section tag of the columns, or a list of one tag per story
+    beamSection           - section tag of the beams, or a list of one tag per floor level (2 ...)
+    Fy, Es, H_kin         - yield stress, elastic and kinematic hardening moduli of the steel
+    numIntgrPts           - number of Gauss integration points of the elements
+    nfdw, nftw, nfbf, nftf - number of fibers of the W-sections
+    diaphragm             - tie the horizontal DOF of the nodes of each floor to the node of pier 1 with equalDOF
+                            (rigid floor diaphragm); the model is then analyzed with the Transformation handler,
+                            model['constraints'] (see Ex5.Benchmark.Diaphragm.py for its cost)
+    colTransfType, beamTransfType - geometric transformation of the columns and of the beams: 'Linear', 'PDelta'
+                            (second-order effects of the gravity loads) or 'Corotational' (large displacements)
+    eleType               - element formulation of all members, one of eleTypes
+    hingeLength           - plastic hinge length of the forceBeamColumn elements, in depths of their section
+    '''
+    colSections = _per_story(colSection, numStory)
+    beamSections = _per_story(beamSection, numStory)
+    sections = {secTag: _section(sections[secTag]) for secTag in set(colSections + beamSections)}
+
+    # number of digits of the pier and level fields of the tags
+    pierBase = 10 ** len(str(numBay + 1))
+    levelBase = 10 ** len(str(numStory + 1))
+
+    def nodeTag(level, pier):
+        return level*pierBase + pier
+
+    # locations of beam/column intersections
+    X = [bay*beamLength for bay in range(numBay + 1)]
+    Y = [story*colHeight for story in range(numStory + 1)]
+
+    # nodes, level 1 is the ground
+    nodes = {}
+    nodeCoords = []
+    for level in range(1, numStory + 2):
+        for pier in range(1, numBay + 2):
+            nodes[(level, pier)] = nodeTag(level, pier)
+            nodeCoords.append([X[pier - 1], Y[level - 1]])
+
+    # boundary condition, nodeTag: X, Y, RZ
+    baseNodes = [nodes[(1, pier)] for pier in range(1, numBay + 2)]
+    fixDOFs = [[1, 1, 0] for tag in baseNodes]
+
+    # rigid floor diaphragm: retained node, constrained node, DOF
+    equalDOFs = []
+    if diaphragm:
+        for level in range(2, numStory + 2):
+            for pier in range(2, numBay + 2):
+                equalDOFs.append([nodes[(level, 1)], nodes[(level, pier)], 1])
+
+    # Hardening Material
+    matHardening = 1
+    H_iso = 0.0             # isotropic hardening Modulus
+    eta = 0.                # visco-plastic coefficient
+    #               Type,       matTag,  E, sigmaY, H_iso, H_kin, eta
+    materials = [["Hardening", matHardening, Es,     Fy, H_iso, H_kin, eta]]
+
+    # the sections that are used
+    secTags = sorted(set(colSections + beamSections))
+
+    # element formulation; the beam integration of a section has the tag of the section
+    if eleType not in eleTypes:
+        raise ValueError('unknown element formulation %r, expected one of %s' % (eleType, eleTypes))
+    elasticSections = []
+    integrations = []
+    if eleType == 'forceBeamColumn':
+        # elastic interior of the plastic-hinge elements, with the properties of the W-section
+        for i, secTag in enumerate(secTags):
+            secElastic = secTags[-1] + i + 1
+            d = sections[secTag][1]
+            W = Wshapes.properties(*sections[secTag][1:5])
+            elasticSections.append(['Elastic', secElastic, Es, W['A'], W['Iz']])
+            integrations.append(['HingeRadau', secTag, secTag, hingeLength*d, secTag, hingeLength*d, secElastic])
+    elif eleType == 'dispBeamColumn':
+        for secTag in secTags:
+            integrations.append(['Legendre', secTag, secTag, numIntgrPts])
+
+    # geometric transformations of element
+    for transfType in (colTransfType, beamTransfType):
+        if transfType not in transfTypes:
+            raise ValueError('unknown geometric transformation %r, expected one of %s' % (transfType, transfTypes))
+    colTransf = 1
+    beamTransf = 2
+
+    # columns, story i connects level i and level i+1
+    columns = {}
+    elements = []   # tag, iNode, jNode, secTag, transfTag
+    for story in range(1, numStory + 1):
+        for pier in range(1, numBay + 2):
+            tag = (1*levelBase + story)*pierBase + pier
+            elements.append([tag, nodes[(story, pier)], nodes[(story + 1, pier)], colSections[story - 1], colTransf])
+            columns[(story, pier)] = tag
+
+    # beams, on levels 2 to numStory+1
+    beams = {}
+    for level in range(2, numStory + 2):
+        for bay in range(1, numBay + 1):
+            tag = (2*levelBase + level)*pierBase + bay
+            elements.append([tag, nodes[(level, bay)], nodes[(level, bay + 1)], beamSections[level - 2], beamTransf])
+            beams[(level, bay)] = tag
+
+    # calculate dead load of frame, assume this to be an internal frame
+    gammaConcrete = 150*unit.pcf    	# Reinforced-Concrete floor slabs
+    tSlab = 6*unit.inch	    	       	# 6-inch slab
+    lSlab = 2*beamLength/2  		    # assume slab extends a distance of 1/2beamLength in/out of plane
+    slabWeight = gammaConcrete*tSlab*lSlab
+    colWeight = [sections[secTag][5] for secTag in colSections]             # per story
+    beamDl = [slabWeight + sections[secTag][5] for secTag in beamSections]  # per floor level
+
+    # each connection takes the mass of 1/2 of each element framing into it (mass=weight/$g)
+    nodeMass = np.zeros((len(nodes), 3))
+    floorWeight = [0.] * (numStory + 2)     # indexed by level
+    for level in range(2, numStory + 2):
+        for pier in range(1, numBay + 2):
+            weight = colWeight[level - 2]*colHeight/2
+            if level <= numStory:
+                weight += colWeight[level - 1]*colHeight/2
+            weight += beamDl[level - 2]*beamLength/2 * ((pier > 1) + (pier <= numBay))
+            nodeMass[(level - 1)*(numBay + 1) + pier - 1, 0] = weight/unit.g
+            floorWeight[level] += weight
+
+    elements = np.array(elements)
+    definition = {
+        'ndm': np.array(2),
+        'ndf': np.array(3),
+        'nodeTags': np.array(list(nodes.values())),
+        'nodeCoords': np.array(nodeCoords, dtype=float),
+        'nodeMass': nodeMass,
+        'fixTags': np.array(baseNodes),
+        'fixDOFs': np.array(fixDOFs),
+        'equalDOFs': np.array(equalDOFs, dtype=int).reshape(-1, 3),
+        'materials': np.array(json.dumps(materials)),
+        'elasticSections': np.array(json.dumps(elasticSections)),
+        'integrations': np.array(json.dumps(integrations)),
+        'secTags': np.array(secTags),
+        'secTitles': np.array([sections[secTag][0] for secTag in secTags]),
+        'secMatTags': np.full(len(secTags), matHardening),
+        'secDims': np.array([sections[secTag][1:5] for secTag in secTags], dtype=float),
+        'secFibers': np.tile([nfdw, nftw, nfbf, nftf], (len(secTags), 1)),
+        'transfTags': np.array([colTransf, beamTransf]),
+        'transfTypes': np.array([colTransfType, beamTransfType]),
+        'eleTags': elements[:, 0],
+        'eleTypes': np.full(len(elements), eleType),
+        'eleNodes': elements[:, 1:3],
+        'eleSecTags': elements[:, 3],
+        'eleTransfTags': elements[:, 4],
+        'eleIntgrPts': np.full(len(elements), numIntgrPts),
+        'eleIntgrTags': elements[:, 3] if integrations else np.zeros(len(elements), dtype=int),
+        }
+
+    return {
+        'numStory': numStory,
+        'numBay': numBay,
+        'colHeight': colHeight,
+        'beamLength': beamLength,
+        'X': X,
+        'Y': Y,
+        'buildingHeight': Y[-1],
+        'nodes': nodes,
+        'columns': columns,
+        'beams': beams,
+        'baseNodes': baseNodes,
+        'storyNodes': [nodes[(level, 1)] for level in range(1, numStory + 2)],  # left column, one per level
+        'tagCtrlNode': nodes[(numStory + 1, 1)],
+        'tagCtrlDOF': 1,
+        'matHardening': matHardening,
+        'numIntgrPts': numIntgrPts,
+        'colWeight': colWeight,
+        'beamDl': beamDl,
+        'floorWeight': floorWeight,
+        'totalWeight': sum(floorWeight),
+        'constraints': 'Transformation' if diaphragm else 'Plain',
+        'definition': definition,
+        'key': Model.key(definition),
+        }
+
+
+def build(*args, **kwargs):
+    # define the frame (arguments of define) and replay it into the domain
+    model = define(*args, **kwargs)
+    Model.replay(model['definition'])
+    return model
+
+
+# entries of the model dictionary keyed by (level, pier), (story, pier) or (level, bay)
+_tagMaps = ['nodes', 'columns', 'beams']
+
+
+def save(fileName, model):
+    # the key is saved with the frame, a load does not hash the definition again
+    frame = {name: value for name, value in model.items() if name != 'definition'}
+    for name in _tagMaps:
+        frame[name] = [[*index, tag] for index, tag in model[name].items()]
+    Model.save(fileName, model['definition'], frame=np.array(json.dumps(frame)))
+
+
+def load(fileName):
+    definition = Model.load(fileName)
+    model = json.loads(str(definition.pop('frame')))
+    for name in _tagMaps:
+        model[name] = {(i, j): tag for i, j, tag in model[name]}
+    model['definition'] = definition
+    Model.replay(definition)
+    return model
+
+
+def gravity_loads(model):
+    # beams (in -ydirection)
+    for (level, bay), tag in model['beams'].items():
+        ops.eleLoad('-ele', tag, '-type', '-beamUniform', -model['beamDl'][level - 2])
+
+    # columns (in -xdirection)
+    for (story, pier), tag in model['columns'].items():
+        ops.eleLoad('-ele', tag, '-type', '-beamUniform', 0, -model['colWeight'][story - 1])
+
+
+def gravity(model, numStepsGravity=10, profiler=None):
+    # set time series and load pattern
+    ops.timeSeries('Linear', 1)
+    ops.pattern('Plain', 1, 1)
+    gravity_loads(model)
+
+    # load-controlled static analysis
+    ops.constraints(model['constraints'])
+    ops.numberer('RCM')
+    ops.system('BandGen')
+    ops.test('NormDispIncr', 1.0e-8, 6)
+    ops.algorithm('Newton')
+    ops.integrator('LoadControl', 1./numStepsGravity)
+    ops.analysis('Static')
+    if profiler is None:
+        ok = ops.analyze(numStepsGravity)
+    else:
+        ok = profiler.analyze(numStepsGravity, stage='gravity', algorithm='Newton')
+
+    # Set the gravity loads to be constant & reset the time in the domain
+    ops.loadConst('-time', 0.0)
+
+    return ok
+
+
+def lateral_loads(model, patternTag=2, tsTag=1):
+    # Fj = ( WjHj/sum(WiHi) ) * totalWeight   at each floor j, equally shared by the nodes of the floor
+    floorWeight = model['floorWeight']
+    Y = model['Y']
+    numStory = model['numStory']
+    numBay = model['numBay']
+
+    sumWiHi = sum(floorWeight[level]*Y[level - 1] for level in range(2, numStory + 2))
+
+    ops.pattern('Plain', patternTag, tsTag)
+    for level in range(2, numStory + 2):
+        Fi = (floorWeight[level]*Y[level - 1]/sumWiHi)*model['totalWeight']/(numBay + 1)
+        for pier in range(1, numBay + 2):
+            ops.load(model['nodes'][(level, pier)], Fi, 0.0, 0.0)
@@ -0,0 +1,111 @@
+# -----------------------------------------------------------------------------
+# GroundMotion.py -- run the Example 5 frame under a suite of ground motions
+#       (c) Farshad Rasuli, 2021-2022
+#
+# E-Mail: farshad.rasuli@gmail.com
+# github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205
+# farshadrasuli.github.io/OpenSeesPy
+# -----------------------------------------------------------------------------
+'''
+run_record(fileName, scale) - rebuild the frame, apply gravity, run a uniform
+        excitation transient analysis and return the peak responses; with
+        driftLimit the analysis stops once a story drift exceeds it (see
+        Transient.py for the records, patterns and the analysis)
+run_records(GMDir, scale, numProcess, reuseGravity) - run every record in
+        GMDir, one record per worker process
+open_pool(numProcess, reuseGravity) - a pool of worker processes and the
+        function func(fileName, scale, driftLimit=None) they run per record,
+        for callers that submit the records themselves (e.g. IDA.py)
+close_pool(pool) - close the pool and release the gravity state
+
+OpenSees keeps a single global domain per process, therefore the records are
+distributed over a pool of processes (not threads). With reuseGravity (the
+default where processes can be forked, see ForkPool.py) the frame is built and
+the gravity and eigenvalue analyses are run once in the parent process, and
+every record starts from a fork of that state; otherwise each worker rebuilds
+the model and repeats gravity before its analysis.
+'''
+
+import os
+import multiprocessing
+
+import openseespy.opensees as ops
+
+import Frame2D as Frame2D
+import Modal as Modal
+import ForkPool as ForkPool
+import Transient as Transient
+
+
+# file extensions accepted as ground-motion records
+recordExtensions = ('.at2',)
+
+# model in the gravity state, shared by the forked workers of run_records
+_model = None
+
+
+def record_files(GMDir):
+    return sorted(os.path.join(GMDir, name) for name in os.listdir(GMDir)
+                  if os.path.splitext(name)[1].lower() in recordExtensions)
+
+
+def run_record(fileName, scale=1.0, driftLimit=None, dampRatio=0.02, tFree=0.0):
+    model = Frame2D.build()
+    Frame2D.gravity(model)
+    return _transient(model, fileName, scale, driftLimit, dampRatio, tFree)
+
+
+def _run_forked(fileName, scale, driftLimit=None):
+    # worker of open_pool, forked after gravity: the domain already holds _model
+    return _transient(_model, fileName, scale, driftLimit)
+
+
+def _transient(model, fileName, scale=1.0, driftLimit=None, dampRatio=0.02, tFree=0.0):
+    # transient analysis of the model in the domain, in its gravity state
+    Transient.rayleigh(dampRatio)
+    dt, duration = Transient.uniform_excitation(fileName, scale)
+    peaks = Transient.analyze(model, duration + tFree, dt, driftLimit, model['constraints'])
+
+    result = {
+        'record': os.path.basename(fileName),
+        'scale': scale,
+        }
+    result.update(peaks)
+
+    ops.wipe()
+
+    return result
+
+
+def open_pool(numProcess=None, reuseGravity=True):
+    # numProcess=None uses all cores of the machine
+    global _model
+    if reuseGravity and ForkPool.available():
+        _model = Frame2D.build()
+        Frame2D.gravity(_model)
+        # the modes of the gravity state are cached here and inherited by the workers
+        Modal.eigen(3)
+        return ForkPool.pool(numProcess), _run_forked
+    return multiprocessing.Pool(numProcess), run_record
+
+
+def close_pool(pool):
+    global _model
+    pool.close()
+    pool.join()
+    if _model is not None:
+        ops.wipe()
+        _model = None
+
+
+def run_records(GMDir, scale=1.0, numProcess=None, reuseGravity=True):
+    # numProcess=None uses all cores of the machine; numProcess=1 runs serially
+    fileNames = record_files(GMDir)
+    if numProcess == 1:
+        return [run_record(fileName, scale) for fileName in fileNames]
+
+    pool, func = open_pool(numProcess, reuseGravity)
+    try:
+        return pool.starmap(func, [(fileName, scale) for fileName in fileNames], chunksize=1)
+    finally:
+        close_pool(pool)
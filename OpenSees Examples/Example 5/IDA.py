@@ -0,0 +1,169 @@
+# -----------------------------------------------------------------------------
+# IDA.py -- incremental dynamic analysis with the hunt & fill algorithm
+#       (c) Farshad Rasuli, 2021-2022
+#
+# E-Mail: farshad.rasuli@gmail.com
+# github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205
+# farshadrasuli.github.io/OpenSeesPy
+#
+# Reference:
+# Vamvatsikos D., Cornell C.A. (2004). Applied Incremental Dynamic Analysis.
+#       Earthquake Spectra, 20(2), 523-553.
+# -----------------------------------------------------------------------------
+'''
+hunt_fill(firstIM, stepIM, incrStepIM, resolution, maxRuns) - generator of the
+        intensities of the runs of one record: send it whether the last run
+        collapsed and it yields the next intensity
+run(GMDir, tableFile, ...) - IDA of every record in GMDir; the runs of all
+        records are executed in a pool of worker processes and each finished
+        run is appended to the results table (CSV) at once. Returns the rows,
+        a dictionary per run:
+            record, run, IM, scale, converged, collapsed, maxDrift (peak
+            interstory drift ratio), maxRoofDrift, time
+collapse_capacity(rows) - per record, the highest intensity without collapse
+        below the lowest collapse, i.e. the flatline of the IDA curve
+
+The intensity measure IM is the peak ground acceleration (PGA) in g, the
+record is scaled by IM/PGA. A run collapses when it does not converge or its
+peak interstory drift exceeds collapseDrift; the transient analysis then stops
+early.
+
+Hunt & fill spends a fixed budget of maxRuns analyses per record:
+    hunt    the intensity increases by stepIM, then by stepIM + incrStepIM,
+            stepIM + 2*incrStepIM, ... until the first collapse
+    bracket the gap between the highest intensity without collapse and the
+            lowest collapse is bisected down to resolution
+    fill    the largest gaps between the intensities without collapse, up
+            to the collapse capacity, are halved, down to resolution, so the
+            IDA curve is evenly traced; a fill run that collapses lowers the
+            collapse capacity, which is bracketed again
+A uniform grid of intensities needs many more runs for the same resolution of
+the collapse capacity, and wastes most of them past the collapse.
+'''
+
+import csv
+import queue
+
+import numpy as np
+
+import GroundMotion as GroundMotion
+import Transient as Transient
+
+
+# columns of the results table
+columns = ['record', 'run', 'IM', 'scale', 'converged', 'collapsed', 'maxDrift', 'maxRoofDrift', 'time']
+
+
+def hunt_fill(firstIM=0.1, stepIM=0.1, incrStepIM=0.05, resolution=0.02, maxRuns=12):
+    runs = {}   # IM: collapsed
+
+    # hunt up to the first collapse
+    IM = firstIM
+    step = stepIM
+    while len(runs) < maxRuns:
+        runs[IM] = yield IM
+        if runs[IM]:
+            break
+        IM += step
+        step += incrStepIM
+    else:
+        return
+
+    while len(runs) < maxRuns:
+        high = min(im for im, collapsed in runs.items() if collapsed)
+        low = max([im for im, collapsed in runs.items() if not collapsed and im < high], default=0.)
+        if high - low > resolution:
+            # bracket the collapse capacity
+            IM = (low + high)/2
+        else:
+            # fill the largest gaps up to the collapse capacity, a fill run that collapses lowers the
+            # capacity (and is bracketed again), so a gap is never halved at the same intensity twice
+            ims = np.array(sorted([0.] + [im for im, collapsed in runs.items() if not collapsed and im <= low]))
+            gaps = np.diff(ims)
+            if len(gaps) == 0 or gaps.max() <= resolution:
+                break
+            i = gaps.argmax()
+            IM = (ims[i] + ims[i + 1])/2
+        runs[IM] = yield IM
+
+
+def _pga(fileName):
+    dt, accel = Transient.read_record(fileName)
+    return float(np.abs(accel).max())
+
+
+def run(GMDir, tableFile, collapseDrift=0.10, firstIM=0.1, stepIM=0.1, incrStepIM=0.05, resolution=0.02,
+        maxRuns=12, numProcess=None, reuseGravity=True):
+    fileNames = GroundMotion.record_files(GMDir)
+    pga = [_pga(fileName) for fileName in fileNames]
+    hunts = [hunt_fill(firstIM, stepIM, incrStepIM, resolution, maxRuns) for fileName in fileNames]
+
+    rows = []
+    numRuns = [0] * len(fileNames)
+    done = queue.Queue()
+    pool, func = GroundMotion.open_pool(numProcess, reuseGravity)
+
+    def submit(index, IM):
+        # the result (or the error) of the run is put in the queue by a thread of the pool
+        pool.apply_async(func, (fileNames[index], IM/pga[index]), {'driftLimit': collapseDrift},
+                         callback=lambda result: done.put((index, IM, result)),
+                         error_callback=lambda error: done.put((index, IM, error)))
+
+    try:
+        with open(tableFile, 'w', newline='') as file:
+            writer = csv.DictWriter(file, columns)
+            writer.writeheader()
+            file.flush()
+
+            # the first run of every record, then the next run of a record as soon as its last one finishes
+            running = 0
+            for index, hunt in enumerate(hunts):
+                submit(index, next(hunt))
+                running += 1
+
+            while running > 0:
+                index, IM, result = done.get()
+                running -= 1
+                if isinstance(result, BaseException):
+                    raise result
+
+                maxDrift = max(result['maxDrift'])
+                collapsed = not result['converged'] or maxDrift > collapseDrift
+                numRuns[index] += 1
+                row = {
+                    'record': result['record'],
+                    'run': numRuns[index],
+                    'IM': IM,
+                    'scale': result['scale'],
+                    'converged': result['converged'],
+                    'collapsed': collapsed,
+                    'maxDrift': maxDrift,
+                    'maxRoofDrift': result['maxRoofDrift'],
+                    'time': result['time'],
+                    }
+                rows.append(row)
+                writer.writerow(row)
+                file.flush()
+
+                try:
+                    submit(index, hunts[index].send(collapsed))
+                    running += 1
+                except StopIteration:
+                    pass
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        GroundMotion.close_pool(pool)
+
+    return rows
+
+
+def collapse_capacity(rows):
+    capacity = {}
+    for record in dict.fromkeys(row['record'] for row in rows):
+        runs = [(row['IM'], row['collapsed']) for row in rows if row['record'] == record]
+        collapses = [IM for IM, collapsed in runs if collapsed]
+        high = min(collapses) if collapses else np.inf
+        capacity[record] = max([IM for IM, collapsed in runs if not collapsed and IM < high], default=0.)
+    return capacity
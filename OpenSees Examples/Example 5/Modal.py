@@ -0,0 +1,131 @@
+# -----------------------------------------------------------------------------
+# Modal.py -- eigenvalue analysis with solver selection and a result cache
+#       (c) Farshad Rasuli, 2021-2022
+#
+# E-Mail: farshad.rasuli@gmail.com
+# github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205
+# farshadrasuli.github.io/OpenSeesPy
+# -----------------------------------------------------------------------------
+'''
+eigen(numModes, solver=None, cacheDir=None, key=None) - eigenvalue analysis of
+        the model in the domain; returns a dictionary of NumPy arrays:
+            eigenValues  ω² (rad²/sec²)
+            omega        circular frequency ω (rad/sec)
+            frequency    f (Hz)
+            period       T (sec)
+            nodeTags     nodes of the model
+            modeShapes   [mode, node, dof] eigenvectors
+select_solver(numModes) - the eigen solver used when solver is None
+model_key() - hash of the model definition in the domain
+clear_cache() - forget the results cached in memory (the files in cacheDir are
+        kept), e.g. between the unrelated models of a long-lived process
+
+The dense '-fullGenLapack' solver is O(n³); it is only used for small models
+(up to denseLimit DOFs) or when many modes are requested compared to the number
+of DOFs with mass, which the band Arpack solver cannot resolve. Otherwise the
+'-genBandArpack' solver is used.
+
+The results are cached, in memory and in cacheDir if given, by the hash of the
+model definition (materials, sections, nodes, masses, elements, fixities and
+the current displacements), or by `key` if given. A repeated build of an
+unchanged model gets its modes from the cache without running the eigen solver;
+the mode shapes are then only available in modeShapes, not in the domain.
+'''
+
+import os
+import hashlib
+import tempfile
+
+import numpy as np
+
+import openseespy.opensees as ops
+
+
+# largest number of DOFs solved with the dense solver
+denseLimit = 200
+
+# results of the analyses of this process, {key: modal}
+_cache = {}
+
+
+def _mass_dofs(nodeTags):
+    return sum(1 for nodeTag in nodeTags for mass in ops.nodeMass(nodeTag) if mass != 0.)
+
+
+def select_solver(numModes):
+    nodeTags = ops.getNodeTags()
+    numDOF = sum(ops.getNDF(nodeTag)[0] for nodeTag in nodeTags)
+    if numDOF <= denseLimit or 2*numModes >= _mass_dofs(nodeTags):
+        return '-fullGenLapack'
+    return '-genBandArpack'
+
+
+def model_key():
+    # the JSON print of the model holds materials, sections, nodes, masses and elements
+    file, fileName = tempfile.mkstemp(suffix='.json')
+    os.close(file)
+    try:
+        ops.printModel('-JSON', '-file', fileName)
+        with open(fileName, 'rb') as file:
+            definition = file.read()
+    finally:
+        os.remove(fileName)
+
+    sha = hashlib.sha1(definition)
+    for nodeTag in ops.getFixedNodes():
+        sha.update(repr((nodeTag, ops.getFixedDOFs(nodeTag))).encode())
+    for nodeTag in ops.getNodeTags():
+        sha.update(np.asarray(ops.nodeDisp(nodeTag), dtype=float).tobytes())
+    return sha.hexdigest()
+
+
+def clear_cache():
+    _cache.clear()
+
+
+def eigen(numModes, solver=None, cacheDir=None, key=None):
+    if key is None:
+        key = model_key()
+    key = '%s-%d' % (key, numModes)
+
+    if key in _cache:
+        return _cache[key]
+
+    fileName = None
+    if cacheDir is not None:
+        fileName = os.path.join(cacheDir, 'eigen-' + key + '.npz')
+        if os.path.exists(fileName):
+            with np.load(fileName) as data:
+                modal = dict(data)
+            _cache[key] = modal
+            return modal
+
+    if solver is None:
+        solver = select_solver(numModes)
+    try:
+        eigenValues = ops.eigen(solver, numModes)
+    except ops.OpenSeesError:
+        if solver == '-fullGenLapack':
+            raise
+        eigenValues = ops.eigen('-fullGenLapack', numModes)
+
+    eigenValues = np.asarray(eigenValues)
+    omega = np.sqrt(eigenValues)
+    nodeTags = np.asarray(ops.getNodeTags())
+    modeShapes = np.array([[ops.nodeEigenvector(int(nodeTag), mode + 1) for nodeTag in nodeTags]
+                           for mode in range(numModes)])
+
+    modal = {
+        'eigenValues': eigenValues,
+        'omega': omega,
+        'frequency': omega/(2.0*np.pi),
+        'period': 2.0*np.pi/omega,
+        'nodeTags': nodeTags,
+        'modeShapes': modeShapes,
+        }
+
+    _cache[key] = modal
+    if fileName is not None:
+        np.savez(fileName, **modal)
+
+    return modal
@@ -0,0 +1,114 @@
+# -----------------------------------------------------------------------------
+# Model.py -- array-backed model definition, saved to and replayed from .npz
+#       (c) Farshad Rasuli, 2021-2022
+#
+# E-Mail: farshad.rasuli@gmail.com
+# github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205
+# farshadrasuli.github.io/OpenSeesPy
+# -----------------------------------------------------------------------------
+'''
+A model definition is a dictionary of NumPy arrays:
+    ndm, ndf            dimensions and DOFs per node
+    nodeTags [n]        nodeCoords [n, ndm]     nodeMass [n, ndf]
+    fixTags [m]         fixDOFs [m, ndf]
+    equalDOFs [k, 3]    retained node, constrained node, DOF
+    materials           uniaxialMaterial arguments, a JSON list
+    secTags [s]         secTitles [s]   secMatTags [s]
+    secDims [s, 4]      d, bf, tf, tw of the W-sections (Wsection.py)
+    secFibers [s, 4]    nfdw, nftw, nfbf, nftf
+    elasticSections     section 'Elastic' arguments, a JSON list
+    transfTags [t]      transfTypes [t]
+    integrations        beamIntegration arguments, a JSON list
+    eleTags [e]         eleTypes [e]    eleNodes [e, 2]
+    eleSecTags [e]      eleTransfTags [e]   eleIntgrPts [e]
+    eleIntgrTags [e]    beam integration of the element, or 0 for numIntgrPts
+                        points of section eleSecTags (nonlinearBeamColumn)
+
+replay(definition) - wipe the domain and define the model, one loop per array
+save(fileName, definition, **arrays) - save the definition, and any other
+        arrays, in a single .npz file
+load(fileName) - the saved dictionary
+key(definition) - content hash of the definition
+
+The key changes with any value of the definition and is the same for a model
+built by its script or loaded from its file, so it can name the cached results
+of the model, e.g. Modal.eigen(numModes, key=Model.key(definition)) for the
+modes of the unloaded model.
+'''
+
+import os
+import json
+import hashlib
+
+import numpy as np
+
+import openseespy.opensees as ops
+
+import Wsection as Wsection
+
+
+def replay(definition):
+    ops.wipe()
+    ops.model('basic', '-ndm', int(definition['ndm']), '-ndf', int(definition['ndf']))
+
+    # plain Python values, OpenSees converts them faster than NumPy scalars
+    nodeTags = definition['nodeTags'].tolist()
+    for nodeTag, coords in zip(nodeTags, definition['nodeCoords'].tolist()):
+        ops.node(nodeTag, *coords)
+
+    for nodeTag, dofs in zip(definition['fixTags'].tolist(), definition['fixDOFs'].tolist()):
+        ops.fix(nodeTag, *dofs)
+
+    for rNodeTag, cNodeTag, dof in definition['equalDOFs'].tolist():
+        ops.equalDOF(rNodeTag, cNodeTag, dof)
+
+    for material in json.loads(str(definition['materials'])):
+        ops.uniaxialMaterial(*material)
+
+    for secTag, secTitle, matTag, dims, fibers in zip(definition['secTags'].tolist(), definition['secTitles'].tolist(),
+                                                      definition['secMatTags'].tolist(), definition['secDims'].tolist(),
+                                                      definition['secFibers'].tolist()):
+        Wsection.section(secTag, secTitle, matTag, *dims, *fibers)
+
+    for section in json.loads(str(definition['elasticSections'])):
+        ops.section(*section)
+
+    for transfTag, transfType in zip(definition['transfTags'].tolist(), definition['transfTypes'].tolist()):
+        ops.geomTransf(transfType, transfTag)
+
+    for integration in json.loads(str(definition['integrations'])):
+        ops.beamIntegration(*integration)
+
+    for eleType, eleTag, (iNode, jNode), numIntgrPts, secTag, transfTag, intgrTag in zip(
+            definition['eleTypes'].tolist(), definition['eleTags'].tolist(), definition['eleNodes'].tolist(),
+            definition['eleIntgrPts'].tolist(), definition['eleSecTags'].tolist(),
+            definition['eleTransfTags'].tolist(), definition['eleIntgrTags'].tolist()):
+        if intgrTag:
+            ops.element(eleType, eleTag, iNode, jNode, transfTag, intgrTag)
+        else:
+            ops.element(eleType, eleTag, iNode, jNode, numIntgrPts, secTag, transfTag)
+
+    for nodeTag, mass in zip(nodeTags, definition['nodeMass'].tolist()):
+        if any(mass):
+            ops.mass(nodeTag, *mass)
+
+
+def save(fileName, definition, **arrays):
+    # write and rename, a reader never loads a truncated file
+    with open(fileName + '.tmp', 'wb') as file:
+        np.savez(file, **definition, **arrays)
+    os.replace(fileName + '.tmp', fileName)
+
+
+def load(fileName):
+    with np.load(fileName) as file:
+        return dict(file)
+
+
+def key(definition):
+    sha = hashlib.sha1()
+    for name in sorted(definition):
+        value = np.ascontiguousarray(definition[name])
+        sha.update(repr((name, value.dtype.str, value.shape)).encode())
+        sha.update(value.tobytes())
+    return sha.hexdigest()
@@ -0,0 +1,117 @@
+# -----------------------------------------------------------------------------
+# Profiler.py -- per-step telemetry of the static and transient analyses
+#       (c) Farshad Rasuli, 2021-2022
+#
+# E-Mail: farshad.rasuli@gmail.com
+# github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205
+# farshadrasuli.github.io/OpenSeesPy
+# -----------------------------------------------------------------------------
+'''
+Profiler() - a log of every call of ops.analyze made through it
+
+    analyze(numSteps, *args, stage, algorithm, fallback) - perform numSteps
+        steps with ops.analyze(1, *args), like ops.analyze(numSteps, *args),
+        and log a row per step:
+            stage       e.g. 'gravity', 'push-over'
+            step        number of the step in its stage (a failed attempt
+                        and its retries share the number of the next step)
+            algorithm   name of the solution algorithm
+            fallback    True if the step was tried before with another
+                        algorithm or a larger increment
+            ok          return value of ops.analyze
+            wallTime    sec
+            iterations  ops.testIter()
+            norm        last norm of the convergence test, ops.testNorm()
+    save(fileName) - write the log as CSV, or as Parquet if fileName ends
+        with '.parquet' (requires pyarrow)
+    summary(numSlowest) - a dictionary of per stage and overall statistics:
+        number of steps and failures, total, p50 and p95 step time, and the
+        numSlowest slowest steps
+    report(numSlowest) - the summary as text
+
+Pushover.adaptive_steps and Frame2D.gravity take a profiler argument. The
+overhead of the log is a few microseconds per step.
+'''
+
+import csv
+import time
+
+import numpy as np
+
+import openseespy.opensees as ops
+
+
+# columns of the log
+columns = ['stage', 'step', 'algorithm', 'fallback', 'ok', 'wallTime', 'iterations', 'norm']
+
+
+class Profiler:
+
+    def __init__(self):
+        self.rows = []
+        self._steps = {}    # converged steps per stage
+
+    def analyze(self, numSteps=1, *args, stage='', algorithm='', fallback=False):
+        ok = 0
+        for i in range(numSteps):
+            step = self._steps.get(stage, 0) + 1
+            tStart = time.perf_counter()
+            ok = ops.analyze(1, *args)
+            wallTime = time.perf_counter() - tStart
+
+            iterations = ops.testIter()
+            norms = ops.testNorm()
+            norm = norms[min(iterations, len(norms)) - 1] if iterations > 0 and norms else float('nan')
+            self.rows.append((stage, step, algorithm, fallback, ok, wallTime, iterations, norm))
+
+            if ok != 0:
+                break
+            self._steps[stage] = step
+        return ok
+
+    def save(self, fileName):
+        if fileName.endswith('.parquet'):
+            import pyarrow
+            import pyarrow.parquet
+            table = pyarrow.table({name: [row[i] for row in self.rows] for i, name in enumerate(columns)})
+            pyarrow.parquet.write_table(table, fileName)
+            return
+
+        with open(fileName, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(columns)
+            writer.writerows(self.rows)
+
+    def summary(self, numSlowest=5):
+        stages = np.array([row[0] for row in self.rows])
+        ok = np.array([row[4] for row in self.rows])
+        wallTime = np.array([row[5] for row in self.rows])
+
+        summary = {}
+        for stage in list(dict.fromkeys(stages.tolist())) + [None]:
+            select = np.ones(len(self.rows), dtype=bool) if stage is None else stages == stage
+            times = wallTime[select]
+            slowest = np.flatnonzero(select)[np.argsort(times)[::-1][:numSlowest]]
+            summary['all' if stage is None else stage] = {
+                'steps': int(np.count_nonzero(ok[select] == 0)),
+                'failures': int(np.count_nonzero(ok[select] != 0)),
+                'wallTime': float(times.sum()),
+                'p50': float(np.percentile(times, 50)) if len(times) else float('nan'),
+                'p95': float(np.percentile(times, 95)) if len(times) else float('nan'),
+                'slowest': [dict(zip(columns, self.rows[i])) for i in slowest],
+                }
+        return summary
+
+    def report(self, numSlowest=5):
+        summary = self.summary(numSlowest)
+        lines = ['%-12s %8s %8s %12s %10s %10s' % ('stage', 'steps', 'failures', 'time [sec]', 'p50 [ms]', 'p95 [ms]')]
+        for stage, stats in summary.items():
+            lines.append('%-12s %8d %8d %12.3f %10.3f %10.3f' % (stage, stats['steps'], stats['failures'],
+                                                                 stats['wallTime'], stats['p50']*1.e3,
+                                                                 stats['p95']*1.e3))
+        lines.append('slowest steps:')
+        for row in summary['all']['slowest']:
+            lines.append('  %-12s step %5d  %-24s %7.2f ms  %2d iterations%s%s'
+                         % (row['stage'], row['step'], row['algorithm'], row['wallTime']*1.e3, row['iterations'],
+                            ', fallback' if row['fallback'] else '', ', failed' if row['ok'] != 0 else ''))
+        return '\n'.join(lines)
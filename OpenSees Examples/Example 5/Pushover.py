@@ -0,0 +1,165 @@
+# -----------------------------------------------------------------------------
+# Pushover.py -- adaptive displacement-controlled static push-over analysis
+#       (c) Farshad Rasuli, 2021-2022
+#
+# E-Mail: farshad.rasuli@gmail.com
+# github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205
+# farshadrasuli.github.io/OpenSeesPy
+# -----------------------------------------------------------------------------
+'''
+adaptive_steps(tagCtrlNode, tagCtrlDOF, maxDisp, incrDisp, tol, maxNumIter, stats)
+        - step generator of a push-over to maxDisp: it yields after every
+          converged step and returns 0 if maxDisp is reached, otherwise the
+          status of the last failed analysis. Use it directly,
+              for step in adaptive_steps(...): pass
+          or through StreamRecorder.record to record every step.
+          The push is in the positive direction of tagCtrlDOF.
+push(model, maxDrift, incrDrift, tol, maxNumIter, stats) - push the model in
+        the domain (Frame2D.py, with its lateral loads) to the roof drift ratio
+        maxDrift in increments of incrDrift with adaptive_steps; returns the
+        status, the capacity curve [roof displacement, base shear] of the
+        converged steps and stats (steps, iterations, ...). Further keyword
+        arguments are passed to adaptive_steps.
+report(stats) - text summary of the statistics of an adaptive push-over
+
+The displacement increment starts at incrDisp. When a step fails with every
+solution algorithm the increment is halved (a cutback), down to minIncrDisp;
+after growAfter consecutive converged steps it is doubled again, up to
+maxIncrDisp. Every step first tries the algorithm that converged last, so a
+stiff stretch of the curve that needs e.g. Newton with Initial Tangent does not
+pay for a failed Newton attempt on each increment.
+
+stats (dict) is filled with: steps, cutbacks, growths, and per algorithm the
+number of converged steps, failed attempts and Newton iterations; push adds
+the total of the iterations. With a
+Profiler (Profiler.py) every attempt is also logged, stage 'push-over'; an
+attempt after a failed algorithm or a cutback is flagged as a fallback.
+'''
+
+import numpy as np
+
+import openseespy.opensees as ops
+
+
+# solution algorithms, in the order they are tried
+#   [name, algorithm arguments, convergence test]
+algorithms = [
+    ['Newton',                  ['Newton'],                  'EnergyIncr'],
+    ['Newton Initial Tangent',  ['Newton', False, True],     'NormDispIncr'],
+    ['Broyden',                 ['Broyden', 8],              'EnergyIncr'],
+    ['Newton Line Search',      ['NewtonLineSearch', 0.8],   'EnergyIncr'],
+    ]
+
+
+def new_stats():
+    return {
+        'steps': 0,
+        'cutbacks': 0,
+        'growths': 0,
+        'algorithms': {name: {'steps': 0, 'failures': 0, 'iterations': 0} for name, args, test in algorithms},
+        }
+
+
+def adaptive_steps(tagCtrlNode, tagCtrlDOF, maxDisp, incrDisp, tol, maxNumIter, stats=None,
+                   minIncrDisp=None, maxIncrDisp=None, growAfter=4, profiler=None):
+    if stats is None:
+        stats = {}
+    stats.update(new_stats())
+    if minIncrDisp is None:
+        minIncrDisp = incrDisp/2**6
+    if maxIncrDisp is None:
+        maxIncrDisp = incrDisp
+
+    def use(index):
+        name, args, test = algorithms[index]
+        ops.test(test, tol, maxNumIter)
+        ops.algorithm(*args)
+
+    incr = incrDisp
+    lastAlgorithm = 0
+    numConverged = 0
+    current = None          # algorithm set in the domain
+    integratorIncr = None   # increment set in the integrator
+    retry = False           # the step failed before with a larger increment
+
+    while True:
+        remaining = maxDisp - ops.nodeDisp(tagCtrlNode, tagCtrlDOF)
+        if remaining <= 0.01*minIncrDisp:
+            return 0
+
+        stepIncr = min(incr, remaining)
+        if stepIncr != integratorIncr:
+            ops.integrator('DisplacementControl', tagCtrlNode, tagCtrlDOF, stepIncr)
+            integratorIncr = stepIncr
+
+        # try the algorithm that converged last, then the others in order
+        order = [lastAlgorithm] + [index for index in range(len(algorithms)) if index != lastAlgorithm]
+        for index in order:
+            if index != current:
+                use(index)
+                current = index
+            if profiler is None:
+                ok = ops.analyze(1)
+            else:
+                ok = profiler.analyze(1, stage='push-over', algorithm=algorithms[index][0],
+                                      fallback=retry or index != order[0])
+            algStats = stats['algorithms'][algorithms[index][0]]
+            algStats['iterations'] += ops.testIter()
+            if ok == 0:
+                algStats['steps'] += 1
+                break
+            algStats['failures'] += 1
+        # end for
+
+        if ok == 0:
+            lastAlgorithm = index
+            stats['steps'] += 1
+            retry = False
+            numConverged += 1
+            if numConverged >= growAfter and incr < maxIncrDisp:
+                incr = min(2*incr, maxIncrDisp)
+                stats['growths'] += 1
+                numConverged = 0
+            yield
+        else:
+            # every algorithm failed, the domain is back at the last converged step
+            if incr/2 < minIncrDisp:
+                return ok
+            incr = incr/2
+            retry = True
+            stats['cutbacks'] += 1
+            numConverged = 0
+    # end while
+
+
+def push(model, maxDrift=0.1, incrDrift=1.e-4, tol=1.0e-8, maxNumIter=6, stats=None, **options):
+    if stats is None:
+        stats = {}
+    tagCtrlNode = model['tagCtrlNode']
+    tagCtrlDOF = model['tagCtrlDOF']
+    baseNodes = model['baseNodes']
+
+    steps = adaptive_steps(tagCtrlNode, tagCtrlDOF, maxDrift*model['buildingHeight'],
+                           incrDrift*model['buildingHeight'], tol, maxNumIter, stats, **options)
+    curve = []
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            ok = stop.value
+            break
+        ops.reactions()
+        curve.append((ops.nodeDisp(tagCtrlNode, tagCtrlDOF),
+                      -sum(ops.nodeReaction(nodeTag, 1) for nodeTag in baseNodes)))
+    # end while
+
+    stats['iterations'] = sum(algStats['iterations'] for algStats in stats['algorithms'].values())
+    return ok, np.array(curve).reshape(-1, 2), stats
+
+
+def report(stats):
+    lines = ['steps: %d, cutbacks: %d, growths: %d' % (stats['steps'], stats['cutbacks'], stats['growths']),
+             '%-24s %8s %8s %10s' % ('algorithm', 'steps', 'failures', 'iterations')]
+    for name, algStats in stats['algorithms'].items():
+        lines.append('%-24s %8d %8d %10d' % (name, algStats['steps'], algStats['failures'], algStats['iterations']))
+    return '\n'.join(lines)
@@ -0,0 +1,54 @@
+# -----------------------------------------------------------------------------
+# Recorders.py -- load the output files of OpenSees recorders into NumPy arrays
+#       (c) Farshad Rasuli, 2021-2022
+#
+# E-Mail: farshad.rasuli@gmail.com
+# github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205
+# farshadrasuli.github.io/OpenSeesPy
+# -----------------------------------------------------------------------------
+'''
+load(fileName, numColumns=None) - return the recorded data as a 2D array,
+        one row per recorded step
+
+Files written with '-binary' (*.bin) are memory-mapped: the rows are read from
+disk only when they are accessed and nothing is parsed. Files written with
+'-file' (*.out) are text and are parsed with numpy.loadtxt.
+
+An OpenSees binary file is a sequence of rows, each row being numColumns
+doubles in the native byte order followed by a newline byte. When numColumns
+is not given it is deduced from the position of the newline bytes.
+'''
+
+import os
+
+import numpy as np
+
+
+def _row_dtype(numColumns):
+    return np.dtype([('values', np.float64, (numColumns,)), ('eol', np.uint8)])
+
+
+def _num_columns(fileName, fileSize):
+    # smallest number of columns for which every row ends with a newline byte
+    data = np.memmap(fileName, dtype=np.uint8, mode='r')
+    for numColumns in range(1, (fileSize - 1)//8 + 1):
+        rowSize = 8*numColumns + 1
+        if fileSize % rowSize == 0 and np.all(data[rowSize - 1::rowSize] == ord('\n')):
+            return numColumns
+    raise ValueError(fileName + ' is not an OpenSees binary recorder file')
+
+
+def load(fileName, numColumns=None):
+    if os.path.splitext(fileName)[1].lower() != '.bin':
+        return np.loadtxt(fileName, ndmin=2)
+
+    fileSize = os.path.getsize(fileName)
+    if fileSize == 0:
+        return np.empty((0, numColumns or 0))
+    if numColumns is None:
+        numColumns = _num_columns(fileName, fileSize)
+
+    # an incomplete last row (e.g. an interrupted analysis) is ignored
+    dtype = _row_dtype(numColumns)
+    rows = np.memmap(fileName, dtype=dtype, mode='r', shape=(fileSize//dtype.itemsize,))
+    return rows['values']
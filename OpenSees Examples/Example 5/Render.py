@@ -0,0 +1,158 @@
+# -----------------------------------------------------------------------------
+# Render.py -- save the model and its results, and render them afterwards
+#       (c) Farshad Rasuli, 2021-2022
+#
+# E-Mail: farshad.rasuli@gmail.com
+# github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205
+# farshadrasuli.github.io/OpenSeesPy
+# -----------------------------------------------------------------------------
+'''
+save(fileName, modal, **arrays) - save the model in the domain (node
+        coordinates, element connectivity, fiber layout of the sections of
+        Wsection.py), its modes (the dictionary of Modal.eigen) and any result
+        arrays, e.g. pushCurve, in a single .npz file
+load(fileName) - the saved dictionary
+render(fileName, figDir, modes, scale) - render the saved model: fiber
+        sections, the model with node and element tags, the mode shapes (the
+        largest displacement drawn as `scale`, in model units) and the capacity
+        curve (if pushCurve was saved); the figures are saved in figDir, or
+        shown when figDir is None
+start(fileName, figDir) - run render in a background process and return it
+        (a subprocess.Popen)
+
+This is the post-processing stage of the scripts: the analysis only saves its
+results, which takes milliseconds, and the output database is never written
+on the critical path. The rendering runs afterwards, either in a background
+process started by the analysis or with
+    python Ex5.Frame2D.InelasticFiberWSection.render.py [fileName] [figDir]
+matplotlib is only imported by render.
+'''
+
+import os
+import sys
+import json
+import warnings
+import subprocess
+
+import numpy as np
+
+import openseespy.opensees as ops
+
+import Wsection as Wsection
+
+
+# script of the rendering stage
+renderScript = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Ex5.Frame2D.InelasticFiberWSection.render.py')
+
+
+def save(fileName, modal=None, **arrays):
+    nodeTags = ops.getNodeTags()
+    eleTags = ops.getEleTags()
+    data = {
+        'nodeTags': np.array(nodeTags),
+        'nodeCoords': np.array([ops.nodeCoord(nodeTag) for nodeTag in nodeTags]),
+        'eleTags': np.array(eleTags),
+        'eleNodes': np.array([ops.eleNodes(eleTag) for eleTag in eleTags]),
+        'fiberSections': np.array(json.dumps({secTag: [secTitle, fib_sec]
+                                              for secTag, (secTitle, fib_sec) in Wsection.fiberSections.items()})),
+        }
+    if modal is not None:
+        data.update({'modal_' + name: value for name, value in modal.items()})
+    data.update(arrays)
+
+    with open(fileName + '.tmp', 'wb') as file:
+        np.savez(file, **data)
+    os.replace(fileName + '.tmp', fileName)
+
+
+def load(fileName):
+    with np.load(fileName) as file:
+        return dict(file)
+
+
+def _finish(plt, figDir, name):
+    if figDir is None:
+        plt.show()
+    else:
+        plt.savefig(os.path.join(figDir, name + '.png'))
+        plt.close()
+
+
+def _plot_frame(ax, data, disp=None, **kwargs):
+    coords = data['nodeCoords'] if disp is None else data['nodeCoords'] + disp
+    index = {nodeTag: i for i, nodeTag in enumerate(data['nodeTags'].tolist())}
+    for nodes in data['eleNodes']:
+        i, j = index[int(nodes[0])], index[int(nodes[1])]
+        ax.plot(coords[[i, j], 0], coords[[i, j], 1], **kwargs)
+
+
+def _render_model(plt, data, figDir):
+    # model with node and element tags
+    fig, ax = plt.subplots()
+    _plot_frame(ax, data, color='k')
+    coords = data['nodeCoords']
+    for nodeTag, (x, y) in zip(data['nodeTags'], coords):
+        ax.annotate(str(nodeTag), (x, y), color='b', fontsize=8)
+    index = {nodeTag: i for i, nodeTag in enumerate(data['nodeTags'].tolist())}
+    for eleTag, nodes in zip(data['eleTags'], data['eleNodes']):
+        x, y = (coords[index[int(nodes[0])]] + coords[index[int(nodes[1])]])/2
+        ax.annotate(str(eleTag), (x, y), color='r', fontsize=8)
+    ax.set_aspect('equal')
+    ax.set_title('Model')
+    _finish(plt, figDir, 'Model')
+
+
+def _render_mode(plt, data, figDir, mode, scale):
+    index = {nodeTag: i for i, nodeTag in enumerate(data['modal_nodeTags'].tolist())}
+    order = [index[nodeTag] for nodeTag in data['nodeTags'].tolist()]
+    shape = data['modal_modeShapes'][mode - 1][order, :2]
+    fig, ax = plt.subplots()
+    _plot_frame(ax, data, color='0.7', linestyle='--')
+    _plot_frame(ax, data, scale*shape/np.abs(shape).max(), color='b')
+    ax.set_aspect('equal')
+    ax.set_title('Mode %d, T = %.3f sec' % (mode, data['modal_period'][mode - 1]))
+    _finish(plt, figDir, 'Mode%d' % mode)
+
+
+def _render_capacity(plt, data, figDir):
+    # capacity curve: [time, roof displacement, sum of base reactions]
+    fig, ax = plt.subplots()
+    ax.plot(data['pushCurve'][:, 1], -data['pushCurve'][:, 2])
+    ax.set_xlabel('roof displacement')
+    ax.set_ylabel('base shear')
+    ax.set_title('Capacity curve')
+    ax.grid(True)
+    _finish(plt, figDir, 'CapacityCurve')
+
+
+def render(fileName, figDir=None, modes=(1,), scale=100.):
+    import matplotlib
+    if figDir is not None:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    data = load(fileName)
+
+    # figures: name, function and its arguments
+    figures = []
+    for secTag, (secTitle, fib_sec) in json.loads(str(data['fiberSections'])).items():
+        Wsection.fiberSections[int(secTag)] = (secTitle, fib_sec)
+        figures.append((secTitle, Wsection.plot_sections, ([int(secTag)], figDir)))
+    figures.append(('Model', _render_model, (plt, data, figDir)))
+    if 'modal_modeShapes' in data:
+        figures += [('Mode%d' % mode, _render_mode, (plt, data, figDir, mode, scale)) for mode in modes]
+    if 'pushCurve' in data:
+        figures.append(('CapacityCurve', _render_capacity, (plt, data, figDir)))
+
+    # a figure that fails is reported and skipped, the others are still rendered
+    for name, function, args in figures:
+        try:
+            function(*args)
+        except Exception as error:
+            warnings.warn('%s not rendered: %r' % (name, error))
+            plt.close('all')
+
+
+def start(fileName, figDir):
+    return subprocess.Popen([sys.executable, renderScript, os.path.abspath(fileName), os.path.abspath(figDir)],
+                            cwd=os.path.dirname(renderScript))
@@ -0,0 +1,164 @@
+# -----------------------------------------------------------------------------
+# Solver.py -- benchmark and select the system, numberer and constraint handler
+#       (c) Farshad Rasuli, 2021-2022
+#
+# E-Mail: farshad.rasuli@gmail.com
+# github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205
+# farshadrasuli.github.io/OpenSeesPy
+# -----------------------------------------------------------------------------
+'''
+setup(system, numberer, constraints) - set the constraint handler, the DOF
+        numberer and the system of equations of the analysis
+select(numDOF, table, constraints) - the fastest (system, numberer,
+        constraints) for a model with numDOF free DOFs, from the benchmarked
+        size nearest to numDOF; with constraints, the fastest with that
+        constraint handler
+auto(table, constraints) - select and set up the fastest combination for the
+        model in the domain; returns it. constraints is the handler the model
+        requires (model['constraints'] of Frame2D.py, 'Transformation' with a
+        rigid diaphragm)
+num_dof() - number of free DOFs of the model in the domain
+benchmark(frameSizes, ...) - time every combination of systems, numberers and
+        constraintHandlers on Example 5 frames of the given sizes; returns a
+        row per frame size and combination:
+            numStory, numBay, numDOF, system, numberer, constraints, time, valid
+fastest(rows) - the table of select: per frame size of a benchmark and per
+        constraint handler, numDOF and the fastest valid combination
+
+Each combination is timed on the gravity analysis followed by numSteps steps of
+the push-over, in a separate process, so a solver that crashes the interpreter
+only marks its combination invalid. A combination is valid if the analysis
+converges and the base shear at the last step agrees with the one of the first
+combination (BandGen, Plain, Plain) within relTol.
+
+Without a table, select uses defaultTable, the output of fastest for the run of
+Ex5.Benchmark.Solver.py in SolverBenchmark.csv (3-story 3-bay, 10-story 5-bay
+and 20-story 10-bay frames). The state determination of the fiber elements
+dominates the cost of a step at these sizes: on that machine the best few
+combinations of each size are within about 10% of each other, and the order
+changes between machines and runs. Benchmark the machine of the analyses and
+pass its table for larger models, where the choice matters. In OpenSeesPy 3.7
+ops.wipe crashes after ops.system('SparseSYM') if no analysis was defined, so
+auto is meant to be followed by the analysis.
+'''
+
+import time
+import itertools
+import concurrent.futures
+
+import openseespy.opensees as ops
+
+import Frame2D as Frame2D
+import Pushover as Pushover
+
+
+# combinations of the benchmark
+systems = ['BandGen', 'BandSPD', 'ProfileSPD', 'UmfPack', 'SparseSYM']
+numberers = ['Plain', 'RCM', 'AMD']
+constraintHandlers = ['Plain', 'Transformation']
+
+# fastest valid combination by model size and constraint handler, Solver.fastest of the rows of
+# Ex5.Benchmark.Solver.py in SolverBenchmark.csv
+#   [numDOF, system, numberer, constraints]
+defaultTable = [
+    [40,   'SparseSYM',  'AMD',   'Plain'],
+    [40,   'ProfileSPD', 'AMD',   'Transformation'],
+    [186,  'SparseSYM',  'Plain', 'Plain'],
+    [186,  'ProfileSPD', 'RCM',   'Transformation'],
+    [671,  'BandGen',    'Plain', 'Plain'],
+    [671,  'SparseSYM',  'AMD',   'Transformation'],
+    ]
+
+
+def setup(system='BandGen', numberer='RCM', constraints='Plain'):
+    ops.constraints(constraints)
+    ops.numberer(numberer)
+    ops.system(system)
+
+
+def num_dof():
+    numDOF = sum(ops.getNDF(nodeTag)[0] for nodeTag in ops.getNodeTags())
+    return numDOF - sum(len(ops.getFixedDOFs(nodeTag)) for nodeTag in ops.getFixedNodes())
+
+
+def select(numDOF, table=None, constraints=None):
+    if table is None:
+        table = defaultTable
+    # the rows of the constraint handler, if the table has any
+    table = [row for row in table if row[3] == constraints] or table
+    # nearest benchmarked size, by ratio
+    row = min(table, key=lambda row: max(numDOF/row[0], row[0]/numDOF))
+    return tuple(row[1:])
+
+
+def auto(table=None, constraints=None):
+    combination = select(num_dof(), table, constraints)
+    if constraints is not None:
+        # a table without the handler of the model
+        combination = combination[:2] + (constraints,)
+    setup(*combination)
+    return combination
+
+
+def _time_combination(numStory, numBay, combination, numSteps, numRepeat):
+    # worker of benchmark: best time of numRepeat analyses, and the base shear at the last step
+    bestTime = float('inf')
+    for repeat in range(numRepeat):
+        model = Frame2D.build(numStory, numBay)
+        numDOF = num_dof()
+
+        tStart = time.perf_counter()
+        ops.timeSeries('Linear', 1)
+        ops.pattern('Plain', 1, 1)
+        Frame2D.gravity_loads(model)
+        setup(*combination)
+        ops.test('NormDispIncr', 1.0e-8, 6)
+        ops.algorithm('Newton')
+        ops.integrator('LoadControl', 0.1)
+        ops.analysis('Static')
+        ok = ops.analyze(10)
+        ops.loadConst('-time', 0.0)
+
+        Frame2D.lateral_loads(model)
+        okPush, curve, stats = Pushover.push(model, numSteps*1.e-4, 1.e-4)
+        bestTime = min(bestTime, time.perf_counter() - tStart)
+
+        if ok == 0:
+            ok = okPush if len(curve) else -1
+        baseShear = curve[-1, 1] if len(curve) else float('nan')
+        ops.wipe()
+
+    return numDOF, bestTime, ok, baseShear
+
+
+def benchmark(frameSizes, numSteps=20, numRepeat=3, relTol=1.e-5,
+              systems=systems, numberers=numberers, constraintHandlers=constraintHandlers):
+    rows = []
+    for numStory, numBay in frameSizes:
+        reference = None
+        for combination in itertools.product(systems, numberers, constraintHandlers):
+            # a new process per combination, a crash of the solver only breaks its pool
+            with concurrent.futures.ProcessPoolExecutor(max_workers=1) as pool:
+                try:
+                    numDOF, wallTime, ok, baseShear = pool.submit(_time_combination, numStory, numBay, combination,
+                                                                   numSteps, numRepeat).result()
+                except concurrent.futures.process.BrokenProcessPool:
+                    numDOF, wallTime, ok, baseShear = None, float('nan'), -1, float('nan')
+
+            if reference is None and ok == 0:
+                reference = baseShear
+            valid = ok == 0 and abs(baseShear - reference) <= relTol*abs(reference)
+            rows.append({'numStory': numStory, 'numBay': numBay, 'numDOF': numDOF, 'system': combination[0],
+                         'numberer': combination[1], 'constraints': combination[2], 'time': wallTime,
+                         'valid': valid})
+    return rows
+
+
+def fastest(rows):
+    table = []
+    for size in dict.fromkeys((row['numStory'], row['numBay'], row['constraints']) for row in rows):
+        valid = [row for row in rows if (row['numStory'], row['numBay'], row['constraints']) == size and row['valid']]
+        if valid:
+            row = min(valid, key=lambda row: row['time'])
+            table.append([row['numDOF'], row['system'], row['numberer'], row['constraints']])
+    return table
@@ -0,0 +1,94 @@
+# -----------------------------------------------------------------------------
+# StreamRecorder.py -- record responses in memory while stepping an analysis
+#       (c) Farshad Rasuli, 2021-2022
+#
+# E-Mail: farshad.rasuli@gmail.com
+# github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205
+# farshadrasuli.github.io/OpenSeesPy
+# -----------------------------------------------------------------------------
+'''
+StreamRecorder(probes, bufferSize) - a Python-side recorder that never writes
+        to disk. Each probe is a tuple (respType, nodeTags, dof) with respType
+        'disp', 'vel', 'accel' or 'reaction'; the recorded value of a probe is
+        the sum of the response over its nodes, e.g.
+            ('disp', [41], 1)                   roof displacement
+            ('reaction', [11, 12, 13, 14], 1)   base shear (with opposite sign)
+
+    analyze(numSteps, *args) - generator: perform numSteps analysis steps with
+        ops.analyze(1, *args) and yield the recorded rows in blocks of up to
+        bufferSize rows, [time, probe 1, probe 2, ...]. The analysis stops at
+        the first step that fails; its return value is then kept in `ok`.
+    record(steps) - generator: the same for any step generator, i.e. one that
+        yields after every converged step and returns the status of the
+        analysis (0 if successful), such as Pushover.adaptive_steps
+    sample(out=None) - the row of the current state of the domain
+
+The rows are written into one preallocated buffer that is reused for every
+block, so a yielded block is only valid until the next one is requested;
+copy it to keep it.
+'''
+
+import numpy as np
+
+import openseespy.opensees as ops
+
+
+_response = {
+    'disp': ops.nodeDisp,
+    'vel': ops.nodeVel,
+    'accel': ops.nodeAccel,
+    'reaction': ops.nodeReaction,
+    }
+
+
+class StreamRecorder:
+
+    def __init__(self, probes, bufferSize=256):
+        for respType, nodeTags, dof in probes:
+            if respType not in _response:
+                raise ValueError('unknown response type: ' + str(respType))
+        self.probes = [(_response[respType], list(nodeTags), dof) for respType, nodeTags, dof in probes]
+        self.reactions = any(respType == 'reaction' for respType, nodeTags, dof in probes)
+        self.buffer = np.empty((bufferSize, 1 + len(probes)))
+        self.ok = 0
+
+    def sample(self, out=None):
+        if out is None:
+            out = np.empty(self.buffer.shape[1])
+        if self.reactions:
+            ops.reactions()
+        out[0] = ops.getTime()
+        for i, (response, nodeTags, dof) in enumerate(self.probes, 1):
+            out[i] = sum(response(nodeTag, dof) for nodeTag in nodeTags)
+        return out
+
+    def analyze(self, numSteps, *args):
+        return self.record(analyze_steps(numSteps, *args))
+
+    def record(self, steps):
+        bufferSize = len(self.buffer)
+        count = 0
+        self.ok = 0
+        while True:
+            try:
+                next(steps)
+            except StopIteration as stop:
+                self.ok = stop.value or 0
+                break
+            self.sample(self.buffer[count])
+            count += 1
+            if count == bufferSize:
+                yield self.buffer
+                count = 0
+        if count > 0:
+            yield self.buffer[:count]
+
+
+def analyze_steps(numSteps, *args):
+    # step generator of numSteps steps of ops.analyze(1, *args)
+    for step in range(numSteps):
+        ok = ops.analyze(1, *args)
+        if ok != 0:
+            return ok
+        yield
+    return 0
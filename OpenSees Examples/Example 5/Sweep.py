@@ -0,0 +1,153 @@
+# -----------------------------------------------------------------------------
+# Sweep.py -- parameter sweeps of the Example 5 frame with a result cache
+#       (c) Farshad Rasuli, 2021-2022
+#
+# E-Mail: farshad.rasuli@gmail.com
+# github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205
+# farshadrasuli.github.io/OpenSeesPy
+# -----------------------------------------------------------------------------
+'''
+grid(**values) - the points of a full grid, e.g.
+        grid(Fy=[50*unit.ksi, 60*unit.ksi], numIntgrPts=[3, 5]) -> 4 points
+latin_hypercube(numPoints, seed, **ranges) - numPoints points of a Latin
+        hypercube sample, e.g. latin_hypercube(20, Fy=[50*unit.ksi, 70*unit.ksi])
+run_point(point, maxDrift, incrDrift, tol, maxNumIter) - build the frame with the parameters of
+        the point (keyword arguments of Frame2D.build, e.g. Fy, H_kin,
+        colHeight, beamLength, numIntgrPts), apply gravity and push it over to
+        the roof drift ratio maxDrift (Pushover.push); returns the result dictionary:
+            converged, numSteps, wallTime, initialStiffness, maxBaseShear,
+            roofDriftAtMax, finalRoofDrift, and the capacity curve 'curve'
+            [roof displacement, base shear]
+point_key(point, maxDrift, incrDrift, tol, maxNumIter) - content hash of the
+        frame of a point (Model.key of its definition, so every argument of
+        Frame2D.define counts, defaults included) and of the push-over
+        settings, the name of its file in the cache
+run(points, cacheDir, resultFile, ...) - run the points that are not in the
+        cache in a pool of worker processes, then write the parameters and the
+        scalar results of every point to resultFile, one column per quantity:
+        NumPy .npz, or Parquet if resultFile ends with '.parquet' (requires
+        pyarrow). Returns the columns as a dictionary of NumPy arrays.
+
+Every result is written to cacheDir as soon as its point finishes, so a sweep
+that is extended with new points, or restarted after a crash, only computes
+the points that are missing.
+'''
+
+import os
+import hashlib
+import itertools
+import concurrent.futures
+import time
+
+import numpy as np
+
+import openseespy.opensees as ops
+
+import Frame2D as Frame2D
+import Pushover as Pushover
+import Model as Model
+
+
+# scalar results of a point, the columns of the results file after the parameters
+resultColumns = ['converged', 'numSteps', 'wallTime', 'initialStiffness', 'maxBaseShear', 'roofDriftAtMax',
+                 'finalRoofDrift']
+
+
+def grid(**values):
+    names = list(values)
+    return [dict(zip(names, combination)) for combination in itertools.product(*values.values())]
+
+
+def latin_hypercube(numPoints, seed=None, **ranges):
+    # one point in each of numPoints equal strata of every parameter, strata paired at random
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for name, (low, high) in ranges.items():
+        u = (rng.permutation(numPoints) + rng.random(numPoints))/numPoints
+        columns[name] = low + u*(high - low)
+    return [{name: float(column[i]) for name, column in columns.items()} for i in range(numPoints)]
+
+
+def point_key(point, maxDrift=0.1, incrDrift=1.e-4, tol=1.0e-8, maxNumIter=6):
+    # the model is defined, not built: the key costs no element of the domain
+    modelKey = Model.key(Frame2D.define(**point)['definition'])
+    settings = repr([float(maxDrift), float(incrDrift), float(tol), int(maxNumIter)])
+    return hashlib.sha1((modelKey + settings).encode()).hexdigest()
+
+
+def run_point(point, maxDrift=0.1, incrDrift=1.e-4, tol=1.0e-8, maxNumIter=6):
+    tStart = time.perf_counter()
+    model = Frame2D.build(**point)
+    ok = Frame2D.gravity(model)
+
+    buildingHeight = model['buildingHeight']
+
+    Frame2D.lateral_loads(model)
+    curve = np.zeros((0, 2))
+    if ok == 0:
+        ok, curve, stats = Pushover.push(model, maxDrift, incrDrift, tol, maxNumIter)
+    ops.wipe()
+
+    roofDisp, baseShear = curve[:, 0], curve[:, 1]
+    converged = ok == 0 and len(curve) > 0 and roofDisp[-1] >= 0.99*maxDrift*buildingHeight
+    iMax = baseShear.argmax() if len(curve) else 0
+    return {
+        'converged': converged,
+        'numSteps': len(curve),
+        'wallTime': time.perf_counter() - tStart,
+        'initialStiffness': baseShear[0]/roofDisp[0] if len(curve) else np.nan,
+        'maxBaseShear': baseShear[iMax] if len(curve) else np.nan,
+        'roofDriftAtMax': roofDisp[iMax]/buildingHeight if len(curve) else np.nan,
+        'finalRoofDrift': roofDisp[-1]/buildingHeight if len(curve) else np.nan,
+        'curve': curve,
+        }
+
+
+def _load(fileName):
+    with np.load(fileName) as data:
+        return {name: data[name][()] if data[name].ndim == 0 else data[name] for name in data.files}
+
+
+def _save(fileName, result):
+    # write and rename, a killed sweep does not leave a truncated result in the cache
+    with open(fileName + '.tmp', 'wb') as file:
+        np.savez(file, **result)
+    os.replace(fileName + '.tmp', fileName)
+
+
+def run(points, cacheDir, resultFile=None, maxDrift=0.1, incrDrift=1.e-4, tol=1.0e-8, maxNumIter=6,
+        numProcess=None):
+    # numProcess=None uses all cores of the machine; numProcess=1 runs serially
+    if not os.path.exists(cacheDir):
+        os.makedirs(cacheDir)
+    fileNames = [os.path.join(cacheDir, 'sweep-%s.npz' % point_key(point, maxDrift, incrDrift, tol, maxNumIter))
+                 for point in points]
+
+    # each missing point once, even if it is repeated in points
+    missing = {fileName: point for fileName, point in zip(fileNames, points) if not os.path.exists(fileName)}
+    if numProcess == 1:
+        for fileName, point in missing.items():
+            _save(fileName, run_point(point, maxDrift, incrDrift, tol, maxNumIter))
+    elif missing:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=numProcess) as pool:
+            futures = {pool.submit(run_point, point, maxDrift, incrDrift, tol, maxNumIter): fileName
+                       for fileName, point in missing.items()}
+            for future in concurrent.futures.as_completed(futures):
+                _save(futures[future], future.result())
+
+    # one column per parameter and per scalar result
+    results = [_load(fileName) for fileName in fileNames]
+    names = list(dict.fromkeys(name for point in points for name in point))
+    columns = {name: np.array([point.get(name, np.nan) for point in points]) for name in names}
+    for name in resultColumns:
+        columns[name] = np.array([result[name] for result in results])
+
+    if resultFile is not None:
+        if resultFile.endswith('.parquet'):
+            import pyarrow
+            import pyarrow.parquet
+            pyarrow.parquet.write_table(pyarrow.table(columns), resultFile)
+        else:
+            np.savez(resultFile, **columns)
+
+    return columns
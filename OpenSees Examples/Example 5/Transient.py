@@ -0,0 +1,193 @@
+# -----------------------------------------------------------------------------
+# Transient.py -- ground-motion records, excitation patterns and transient
+#       analysis of the Example 5 frame
+#       (c) Farshad Rasuli, 2021-2022
+#
+# E-Mail: farshad.rasuli@gmail.com
+# github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205
+# farshadrasuli.github.io/OpenSeesPy
+# -----------------------------------------------------------------------------
+'''
+read_record(fileName) - read a PEER record, of the NGA or of the old strong-
+        motion database: acceleration (*.AT2, in g), velocity (*.VT2, cm/sec)
+        or displacement (*.DT2, cm); returns dt and a NumPy array of the values
+rayleigh(dampRatio, modes, cacheDir) - Rayleigh damping of the model in the
+        domain, dampRatio at the two modes (1-based), from the periods of
+        Modal.eigen; returns alphaM and betaK
+uniform_excitation(fileName, scale, direction) - UniformExcitation pattern of
+        an acceleration record, scaled by `scale`; returns dt and the duration
+multiple_support(records, scale, direction) - MultipleSupport pattern, a
+        record imposed on each support node, records = {nodeTag: fileName};
+        displacement records (*.DT2) are imposed as displacements, the others
+        are integrated by OpenSees. The fix of the excited DOF is replaced by
+        the imposed motion. Returns dt and the duration.
+analyze(model, duration, dt, driftLimit, constraints) - transient analysis of
+        the model in the domain up to `duration`, in steps of dt; returns the
+        peak responses, displacements relative to the base. With driftLimit
+        the analysis stops once a story drift exceeds it. The motions imposed
+        on the fixed supports of a MultipleSupport pattern are only enforced
+        by the 'Transformation' constraint handler. The last step ends at
+        `duration`: past the end of a record the ground displacement that
+        OpenSees integrates from an acceleration or a velocity record drops to
+        zero, only a displacement record holds its last value.
+
+The records are parsed in bulk by NumPy and cached as .npy files next to the
+source (e.g. RSN1.AT2.npy); a record read again, by another analysis or worker
+process, is loaded from the binary cache. A cache older than its record is
+read again. The modes of the Rayleigh damping come from the cache of
+Modal.eigen, so the eigenvalue analysis runs once per model.
+'''
+
+import os
+
+import numpy as np
+
+import openseespy.opensees as ops
+
+import LibUnits as unit
+import Modal as Modal
+
+
+# quantity of the PEER NGA record types: ground-motion argument and unit of the values
+recordTypes = {
+    '.at2': ('-accel', unit.g),
+    '.vt2': ('-vel', unit.cm/unit.sec),
+    '.dt2': ('-disp', unit.cm),
+    }
+
+
+def _parse(fileName):
+    # PEER format: 3 lines of description, then the header, then the values; the header is
+    # 'NPTS=  nnnn, DT=   .ddd SEC' (NGA) or '  nnnn   .ddd   NPTS, DT' (old PEER strong-motion database)
+    with open(fileName) as file:
+        lines = [file.readline() for i in range(4)]
+        values = np.fromstring(file.read(), sep=' ')
+    header = lines[3].upper().replace(',', ' ').replace('=', ' ').split()
+    try:
+        if header[-2:] == ['NPTS', 'DT']:
+            npts, dt = int(header[0]), float(header[1])
+        else:
+            npts = int(header[header.index('NPTS') + 1])
+            dt = float(header[header.index('DT') + 1])
+    except (ValueError, IndexError):
+        raise ValueError('%s: header %r is neither "NPTS= n, DT= dt SEC" nor "n dt NPTS, DT"'
+                         % (fileName, lines[3].strip())) from None
+    if len(values) < npts:
+        raise ValueError('%s: %d of %d values read' % (fileName, len(values), npts))
+    return dt, values[:npts]
+
+
+def read_record(fileName):
+    # the cache holds dt followed by the values
+    cacheName = fileName + '.npy'
+    if os.path.exists(cacheName) and os.path.getmtime(cacheName) >= os.path.getmtime(fileName):
+        data = np.load(cacheName)
+        return float(data[0]), data[1:]
+
+    dt, values = _parse(fileName)
+    try:
+        # write and rename, a parallel reader never loads a truncated cache
+        with open(cacheName + '.%d.tmp' % os.getpid(), 'wb') as file:
+            np.save(file, np.concatenate([[dt], values]))
+        os.replace(cacheName + '.%d.tmp' % os.getpid(), cacheName)
+    except OSError:
+        # read-only record directory, parse it every time
+        pass
+    return dt, values
+
+
+def rayleigh(dampRatio=0.02, modes=(1, 3), cacheDir=None):
+    # dampRatio at the circular frequencies wi and wj of the two modes
+    period = Modal.eigen(max(modes), cacheDir=cacheDir)['period']
+    wi, wj = 2.0*np.pi/period[modes[0] - 1], 2.0*np.pi/period[modes[1] - 1]
+    alphaM = dampRatio*2*wi*wj/(wi + wj)
+    betaK = dampRatio*2/(wi + wj)
+    ops.rayleigh(alphaM, 0.0, 0.0, betaK)
+    return alphaM, betaK
+
+
+def uniform_excitation(fileName, scale=1.0, direction=1, patternTag=2, tsTag=2):
+    dt, accel = read_record(fileName)
+    ops.timeSeries('Path', tsTag, '-dt', dt, '-values', *accel, '-factor', scale*unit.g)
+    ops.pattern('UniformExcitation', patternTag, direction, '-accel', tsTag)
+    return dt, len(accel)*dt
+
+
+def multiple_support(records, scale=1.0, direction=1, patternTag=2, tsTag=2):
+    # one time series and ground motion per record, shared by the nodes it is imposed on
+    ops.pattern('MultipleSupport', patternTag)
+    gmTags = {}
+    dt, duration = None, 0.
+    for nodeTag, fileName in records.items():
+        if fileName not in gmTags:
+            quantity, factor = recordTypes[os.path.splitext(fileName)[1].lower()]
+            dtRecord, values = read_record(fileName)
+            gmTags[fileName] = len(gmTags) + 1
+            # a support keeps its final displacement after the end of the record (free vibration)
+            useLast = ['-useLast'] if quantity == '-disp' else []
+            ops.timeSeries('Path', tsTag + gmTags[fileName] - 1, '-dt', dtRecord, '-values', *values,
+                           '-factor', scale*factor, *useLast)
+            ops.groundMotion(gmTags[fileName], 'Plain', quantity, tsTag + gmTags[fileName] - 1)
+            dt = dtRecord if dt is None else min(dt, dtRecord)
+            # the time of the last value, past it the integrated ground displacement drops to zero
+            duration = max(duration, (len(values) - 1)*dtRecord)
+        # a single constraint per DOF, the imposed motion replaces the fix of the support
+        if direction in ops.getFixedDOFs(nodeTag):
+            ops.remove('sp', nodeTag, direction)
+        ops.imposedMotion(nodeTag, direction, gmTags[fileName])
+    return dt, duration
+
+
+def analyze(model, duration, dt, driftLimit=None, constraints='Plain'):
+    ops.wipeAnalysis()
+    ops.constraints(constraints)
+    ops.numberer('RCM')
+    ops.system('BandGen')
+    ops.test('NormDispIncr', 1.0e-8, 10)
+    ops.algorithm('Newton')
+    ops.integrator('Newmark', 0.5, 0.25)
+    ops.analysis('Transient')
+
+    storyNodes = model['storyNodes']
+    baseNodes = model['baseNodes']
+    numStory = model['numStory']
+    colHeight = model['colHeight']
+    tMax = ops.getTime() + duration
+
+    maxRoofDisp = 0.
+    maxBaseShear = 0.
+    maxDrift = [0.] * numStory
+    ok = 0
+    # the last step is cut to end at tMax, not past it (round-off of the time left aside)
+    while ok == 0 and tMax - ops.getTime() > 1.e-6*dt:
+        step = min(dt, tMax - ops.getTime())
+        ok = ops.analyze(1, step)
+        # if analysis fails, subdivide the step and try Newton with Initial Tangent
+        if ok != 0:
+            ops.algorithm('Newton', False, True)
+            ok = ops.analyze(4, step/4)
+            ops.algorithm('Newton')
+        if ok != 0:
+            break
+
+        # displacements relative to the base, which moves under a MultipleSupport excitation
+        disp = [ops.nodeDisp(nodeTag, 1) for nodeTag in storyNodes]
+        for story in range(numStory):
+            maxDrift[story] = max(maxDrift[story], abs(disp[story + 1] - disp[story])/colHeight)
+        maxRoofDisp = max(maxRoofDisp, abs(disp[-1] - disp[0]))
+
+        ops.reactions()
+        maxBaseShear = max(maxBaseShear, abs(sum(ops.nodeReaction(nodeTag, 1) for nodeTag in baseNodes)))
+
+        # the frame has collapsed, the rest of the record adds nothing
+        if driftLimit is not None and max(maxDrift) > driftLimit:
+            break
+
+    return {
+        'converged': ok == 0,
+        'time': ops.getTime(),
+        'maxRoofDisp': maxRoofDisp,
+        'maxRoofDrift': maxRoofDisp/model['buildingHeight'],
+        'maxDrift': maxDrift,
+        'maxBaseShear': maxBaseShear,
+        }
@@ -22,6 +22,16 @@ input arguments:
 	nftw = number of fibers along web thickness
 	nfbf = number of fibers along flange width
 	nftf = number of fibers along flange thickness
+	plot = render the fiber section right away (default: False)
+
+shape(secTag, shapeName, matTag, nfdw, nftw, nfbf, nftf, plot) defines the
+section of a W-shape of the database by its designation (see Wshapes.py).
+
+The fiber layout of every defined section is kept in `fiberSections`, so the
+plots can be rendered later in one batch with `plot_sections()`, e.g. after the
+analysis or on a machine with a display. matplotlib is only imported when a
+plot is actually requested. clear() forgets them, e.g. before the next model of
+a long-lived process.
 '''
 # Section profile
 #         /──────────bf─────────/         
@@ -45,41 +55,92 @@ input arguments:
 #                  /tw/
 # 
 
+import os
+
 import openseespy.opensees as ops
-import openseespy.postprocessing.ops_vis as opsv
-
-import matplotlib.pyplot as plt
-
-def section(secTag, secTitle, matTag, d, bf, tf, tw, nfdw, nftw, nfbf, nftf):
-    dw = d - 2*tf
-    y1 = - d / 2
-    y2 = - dw / 2
-    y3 = dw / 2
-    y4 = d / 2
-
-    z1 = - bf / 2
-    z2 = - tw / 2
-    z3 =  tw / 2
-    z4 =  bf / 2
-    
-    #            secType, secTag
-    ops.section( 'Fiber', secTag)
-    #           type, matTag, numSubdivIJ, numSubdivJK, yI, zI, yJ, zJ, yK, zK, yL, zL
-    # bottom flange
-    ops.patch('quad', matTag,        nfbf,        nftf, y1, z4, y1, z1, y2, z1, y2, z4)
-    # web
-    ops.patch('quad', matTag,        nftw,        nfdw, y2, z3, y2, z2, y3, z2, y3, z3)
-    # top flange
-    ops.patch('quad', matTag,        nfbf,        nftf, y3, z4, y3, z1, y4, z1, y4, z4)
+
+import Wshapes as Wshapes
+
+
+# fiber layout of the defined sections, {secTag: (secTitle, fib_sec)}
+fiberSections = {}
+
+
+def clear():
+    fiberSections.clear()
+
+
+def section(secTag, secTitle, matTag, d, bf, tf, tw, nfdw, nftw, nfbf, nftf, plot=False):
+    # patch coordinates are computed once per geometry (cached in Wshapes)
+    (y1, y2, y3, y4), (z1, z2, z3, z4) = Wshapes.coordinates(d, bf, tf, tw)
 
     fib_sec = [
         ['section', 'Fiber', secTag, '-GJ', 0],
-        ['patch', 'quad', matTag,        nfbf,        nftf, y1, z4, y1, z1, y2, z1, y2, z4],
-        ['patch', 'quad', matTag,        nftw,        nfdw, y2, z3, y2, z2, y3, z2, y3, z3],
-        ['patch', 'quad', matTag,        nfbf,        nftf, y3, z4, y3, z1, y4, z1, y4, z4]
+        #         type, matTag, numSubdivIJ, numSubdivJK, yI, zI, yJ, zJ, yK, zK, yL, zL
+        ['patch', 'quad', matTag,        nfbf,        nftf, y1, z4, y1, z1, y2, z1, y2, z4], # bottom flange
+        ['patch', 'quad', matTag,        nftw,        nfdw, y2, z3, y2, z2, y3, z2, y3, z3], # web
+        ['patch', 'quad', matTag,        nfbf,        nftf, y3, z4, y3, z1, y4, z1, y4, z4]  # top flange
               ]
-    opsv.plot_fiber_section(fib_sec, matcolor='r')
-    plt.axis('equal')
-    plt.title(secTitle)
-    plt.gca().invert_xaxis()
-    plt.show()
+
+    #            secType, secTag
+    ops.section( 'Fiber', secTag)
+    for patch in fib_sec[1:]:
+        ops.patch(*patch[1:])
+
+    fiberSections[secTag] = (secTitle, fib_sec)
+
+    if plot:
+        plot_sections([secTag])
+
+    return fib_sec
+
+
+def shape(secTag, shapeName, matTag, nfdw, nftw, nfbf, nftf, plot=False):
+    # W-section by its designation in the W-shape database, e.g. 'W27x114'
+    W = Wshapes.shape(shapeName)
+    return section(secTag, shapeName, matTag, W['d'], W['bf'], W['tf'], W['tw'], nfdw, nftw, nfbf, nftf, plot)
+
+
+def _plot_patch(ax, patch, color):
+    # quad patch subdivided into its fibers, drawn in the z-y plane (z to the left, y up)
+    numSubdivIJ, numSubdivJK = patch[3], patch[4]
+    (yI, zI), (yJ, zJ), (yK, zK), (yL, zL) = [patch[i:i + 2] for i in range(5, 13, 2)]
+    for i in range(numSubdivIJ):
+        for j in range(numSubdivJK):
+            cell = []
+            for r, s in [(i, j), (i + 1, j), (i + 1, j + 1), (i, j + 1)]:
+                # bilinear map of the unit square to the quad IJKL
+                r, s = r/numSubdivIJ, s/numSubdivJK
+                y = (1 - r)*(1 - s)*yI + r*(1 - s)*yJ + r*s*yK + (1 - r)*s*yL
+                z = (1 - r)*(1 - s)*zI + r*(1 - s)*zJ + r*s*zK + (1 - r)*s*zL
+                cell.append((z, y))
+            ax.fill(*zip(*cell), facecolor=color, edgecolor='k', linewidth=0.5)
+
+
+def plot_sections(secTags=None, figDir=None):
+    '''
+    Render the fiber layout of the defined sections.
+
+    secTags - section tags to render (default: all defined sections)
+    figDir  - directory to save the figures as secTitle.png; when None the
+              figures are shown on screen
+    '''
+    # plotting modules are imported only here, so building a model never pays for them
+    import matplotlib.pyplot as plt
+
+    if secTags is None:
+        secTags = list(fiberSections)
+
+    for secTag in secTags:
+        secTitle, fib_sec = fiberSections[secTag]
+        fig, ax = plt.subplots()
+        for patch in fib_sec[1:]:
+            _plot_patch(ax, patch, 'r')
+        ax.set_aspect('equal')
+        ax.set_title(secTitle)
+        ax.invert_xaxis()
+        if figDir is None:
+            plt.show()
+        else:
+            plt.savefig(os.path.join(figDir, secTitle + '.png'))
+            plt.close()
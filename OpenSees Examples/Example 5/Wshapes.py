@@ -0,0 +1,169 @@
+# -----------------------------------------------------------------------------
+# Wshapes.py -- W-shape database, section properties and fiber meshes
+#       (c) Farshad Rasuli, 2021-2022
+#
+# E-Mail: farshad.rasuli@gmail.com
+# github.com/farshadrasuli/OpenSeesPy/tree/main/OpenSees%20Examples/Example%205
+# farshadrasuli.github.io/OpenSeesPy
+# -----------------------------------------------------------------------------
+'''
+shape(name) - nominal dimensions of a W-shape by designation, e.g. 'W27x114',
+        as a dictionary {shape, d, bf, tf, tw, W} in the units of LibUnits
+        (W is the weight per length)
+names() - designations in the database (Wshapes.csv)
+coordinates(d, bf, tf, tw) - y and z coordinates of the corners of the three
+        patches (bottom flange, web, top flange) of Wsection.section
+properties(d, bf, tf, tw) - area A, moments of inertia Iz (strong axis) and Iy,
+        elastic modulus Sz and plastic modulus Zz of the W-section made of
+        three rectangles (no fillets), i.e. the section the fibers discretize
+fiber_mesh(d, bf, tf, tw, nfdw, nftw, nfbf, nftf) - y, z coordinates and areas
+        of the fibers of Wsection.section, as NumPy arrays
+mesh_properties(y, z, area) - A, Iz, Iy and Zz implied by a fiber mesh
+mesh_error(d, bf, tf, tw, nfdw, nftw, nfbf, nftf) - relative error of the
+        properties of the fiber mesh with respect to the exact properties
+recommend_mesh(d, bf, tf, tw, tol, ndm) - coarsest mesh (fewest fibers) whose
+        properties are all within tol of the exact ones, as a dictionary
+        {nfdw, nftw, nfbf, nftf, numFibers, error}
+
+Fewer fibers per section cut the state-determination cost of every
+nonlinearBeamColumn element. In a 2D model (ndm=2) only the y coordinate of a
+fiber counts, so subdividing the flange width (nfbf) or the web thickness
+(nftw) adds fibers without changing the response; the recommended mesh then
+has nfbf = nftw = 1.
+
+The database is read once, and the results of the other functions are cached
+by their arguments, so defining many sections in a loop (e.g. a design
+optimization) computes each geometry and fiber mesh only once. The cached
+arrays are read-only; copy them to modify.
+'''
+
+import os
+import csv
+import functools
+
+import numpy as np
+
+import LibUnits as unit
+
+
+# W-shape database file, dimensions in inch and weight in lb/ft
+databaseFile = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Wshapes.csv')
+
+
+@functools.lru_cache(maxsize=None)
+def _database():
+    with open(databaseFile, newline='') as file:
+        rows = csv.DictReader(line for line in file if not line.startswith('#'))
+        return {row['shape']: (float(row['d']), float(row['bf']), float(row['tf']), float(row['tw']), float(row['W']))
+                for row in rows}
+
+
+def names():
+    return list(_database())
+
+
+def shape(name):
+    try:
+        d, bf, tf, tw, W = _database()[name]
+    except KeyError:
+        raise ValueError('unknown W-shape: ' + str(name)) from None
+    return {'shape': name, 'd': d*unit.inch, 'bf': bf*unit.inch, 'tf': tf*unit.inch, 'tw': tw*unit.inch,
+            'W': W*unit.lbf/unit.ft}
+
+
+@functools.lru_cache(maxsize=None)
+def coordinates(d, bf, tf, tw):
+    dw = d - 2*tf
+    y = (- d / 2, - dw / 2, dw / 2, d / 2)
+    z = (- bf / 2, - tw / 2, tw / 2, bf / 2)
+    return y, z
+
+
+@functools.lru_cache(maxsize=None)
+def properties(d, bf, tf, tw):
+    dw = d - 2*tf
+    A = 2*bf*tf + dw*tw
+    Iz = (bf*d**3 - (bf - tw)*dw**3)/12
+    Iy = (2*tf*bf**3 + dw*tw**3)/12
+    Sz = 2*Iz/d
+    Zz = bf*tf*(d - tf) + tw*dw**2/4
+    return {'A': A, 'Iz': Iz, 'Iy': Iy, 'Sz': Sz, 'Zz': Zz}
+
+
+def _rectangle(y1, y2, z1, z2, ny, nz):
+    # fibers of a rectangle subdivided ny times along y and nz times along z
+    dy = (y2 - y1)/ny
+    dz = (z2 - z1)/nz
+    y, z = np.meshgrid(y1 + dy*(np.arange(ny) + 0.5), z1 + dz*(np.arange(nz) + 0.5), indexing='ij')
+    return y.ravel(), z.ravel(), np.full(ny*nz, dy*dz)
+
+
+@functools.lru_cache(maxsize=None)
+def fiber_mesh(d, bf, tf, tw, nfdw, nftw, nfbf, nftf):
+    (y1, y2, y3, y4), (z1, z2, z3, z4) = coordinates(d, bf, tf, tw)
+    parts = [_rectangle(y1, y2, z1, z4, nftf, nfbf),    # bottom flange
+             _rectangle(y2, y3, z2, z3, nfdw, nftw),    # web
+             _rectangle(y3, y4, z1, z4, nftf, nfbf)]    # top flange
+    y, z, area = (np.concatenate(arrays) for arrays in zip(*parts))
+    for array in (y, z, area):
+        array.setflags(write=False)
+    return y, z, area
+
+
+def mesh_properties(y, z, area):
+    A = area.sum()
+    yc = (area*y).sum()/A
+    zc = (area*z).sum()/A
+    Iz = (area*(y - yc)**2).sum()
+    Iy = (area*(z - zc)**2).sum()
+    # plastic neutral axis: the weighted median of y, half of the area on each side
+    order = np.argsort(y, kind='stable')
+    yp = y[order][np.searchsorted(np.cumsum(area[order]), A/2)]
+    Zz = (area*np.abs(y - yp)).sum()
+    return {'A': float(A), 'Iz': float(Iz), 'Iy': float(Iy), 'Zz': float(Zz)}
+
+
+def mesh_error(d, bf, tf, tw, nfdw, nftw, nfbf, nftf):
+    exact = properties(d, bf, tf, tw)
+    mesh = mesh_properties(*fiber_mesh(d, bf, tf, tw, nfdw, nftw, nfbf, nftf))
+    return {name: (mesh[name] - exact[name])/exact[name] for name in mesh}
+
+
+def recommend_mesh(d, bf, tf, tw, tol=0.01, ndm=2, maxNfdw=32, maxNftf=8, maxNfbf=64, maxNftw=4):
+    # The properties of a mesh of centroid fibers have a closed form: a rectangle b x h
+    # subdivided n times along h loses b*h**3/12/n**2 of its own moment of inertia, and an
+    # odd web subdivision lumps the middle strip on the neutral axis, losing tw*(dw/nfdw)**2/4
+    # of the plastic modulus. This evaluates every candidate mesh at once on a NumPy grid.
+    exact = properties(d, bf, tf, tw)
+    dw = d - 2*tf
+
+    nfdw = np.arange(1, maxNfdw + 1)[:, None, None, None]
+    nftf = np.arange(1, maxNftf + 1)[None, :, None, None]
+    if ndm == 2:
+        nfbf = np.ones((1, 1, 1, 1), dtype=int)
+        nftw = np.ones((1, 1, 1, 1), dtype=int)
+    else:
+        nfbf = np.arange(1, maxNfbf + 1)[None, None, :, None]
+        nftw = np.arange(1, maxNftw + 1)[None, None, None, :]
+
+    error = {
+        'A': np.zeros((1, 1, 1, 1)),
+        'Iz': -(2*bf*tf**3/12/nftf**2 + tw*dw**3/12/nfdw**2)/exact['Iz'],
+        'Zz': -(nfdw % 2)*tw*(dw/nfdw)**2/4/exact['Zz'],
+        }
+    if ndm != 2:
+        error['Iy'] = -(2*tf*bf**3/12/nfbf**2 + dw*tw**3/12/nftw**2)/exact['Iy']
+
+    numFibers = 2*nfbf*nftf + nftw*nfdw
+    ok = np.ones(np.broadcast_shapes(*(np.shape(e) for e in error.values()), numFibers.shape), dtype=bool)
+    for e in error.values():
+        ok &= np.abs(e) <= tol
+    if not ok.any():
+        raise ValueError('no fiber mesh within the tolerance %g' % tol)
+
+    cost = np.where(ok, np.broadcast_to(numFibers, ok.shape), np.iinfo(int).max)
+    i, j, k, l = np.unravel_index(np.argmin(cost), cost.shape)
+    mesh = {'nfdw': int(nfdw.flat[i]), 'nftf': int(nftf.flat[j]), 'nfbf': int(nfbf.flat[k]), 'nftw': int(nftw.flat[l])}
+    mesh['numFibers'] = 2*mesh['nfbf']*mesh['nftf'] + mesh['nftw']*mesh['nfdw']
+    mesh['error'] = {name: float(np.broadcast_to(e, ok.shape)[i, j, k, l]) for name, e in error.items()}
+    return mesh
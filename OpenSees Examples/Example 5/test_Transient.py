@@ -0,0 +1,67 @@
+# -----------------------------------------------------------------------------
+# test_Transient.py -- tests of the record reader of Transient.py
+#       run with: python -m pytest test_Transient.py
+# -----------------------------------------------------------------------------
+
+import os
+
+import numpy as np
+import pytest
+
+import Transient as Transient
+
+
+values = [0.0, 0.01, -0.02, 0.015, -0.005]
+
+
+def write_record(fileName, header, values=values):
+    with open(fileName, 'w') as file:
+        file.write('PEER STRONG MOTION DATABASE RECORD\n')
+        file.write('TEST RECORD, 5 POINTS\n')
+        file.write('ACCELERATION TIME SERIES IN UNITS OF G\n')
+        file.write(header + '\n')
+        file.write('  '.join('%15.7E' % value for value in values) + '\n')
+
+
+def test_nga_header(tmp_path):
+    fileName = str(tmp_path / 'nga.AT2')
+    write_record(fileName, 'NPTS=     5, DT=   .0100 SEC')
+    dt, accel = Transient.read_record(fileName)
+    assert dt == 0.01
+    np.testing.assert_array_equal(accel, values)
+
+
+def test_old_peer_header(tmp_path):
+    fileName = str(tmp_path / 'old.AT2')
+    write_record(fileName, '    5    0.0100    NPTS, DT')
+    dt, accel = Transient.read_record(fileName)
+    assert dt == 0.01
+    np.testing.assert_array_equal(accel, values)
+
+
+def test_unknown_header(tmp_path):
+    fileName = str(tmp_path / 'bad.AT2')
+    write_record(fileName, 'NUMBER OF POINTS 5, TIME STEP 0.01')
+    with pytest.raises(ValueError, match='bad.AT2'):
+        Transient.read_record(fileName)
+
+
+def test_cache(tmp_path):
+    fileName = str(tmp_path / 'cached.AT2')
+    write_record(fileName, 'NPTS=     5, DT=   .0100 SEC')
+    Transient.read_record(fileName)
+    assert os.path.exists(fileName + '.npy')
+
+    # a cache newer than its record is read instead of the record
+    write_record(fileName, 'NPTS=     5, DT=   .0100 SEC', [1.0]*5)
+    cacheTime = os.path.getmtime(fileName + '.npy')
+    os.utime(fileName, (cacheTime - 10, cacheTime - 10))
+    dt, accel = Transient.read_record(fileName)
+    assert dt == 0.01
+    np.testing.assert_array_equal(accel, values)
+
+    # a record newer than its cache is parsed again, and the cache rewritten
+    os.utime(fileName, (cacheTime + 10, cacheTime + 10))
+    dt, accel = Transient.read_record(fileName)
+    np.testing.assert_array_equal(accel, [1.0]*5)
+    np.testing.assert_array_equal(np.load(fileName + '.npy'), [0.01] + [1.0]*5)
@@ -0,0 +1,159 @@
+# -----------------------------------------------------------------------------
+# UnitSystem.py -- define a system of units and convert between units
+#       (c) Farshad Rasuli, 2021-2022
+#
+# E-Mail: farshad.rasuli@gmail.com
+# github.com/farshadrasuli/OpenSeesPy
+# farshadrasuli.github.io/OpenSeesPy
+#
+# Inspired from:
+# LibUnits.tcl -- define system of units
+#		Silvia Mazzoni & Frank McKenna, 2006
+# -----------------------------------------------------------------------------
+'''
+UnitSystem(length, force, time) - a system of units given its basic units
+        (output units), e.g. UnitSystem('m', 'N', 'sec') or SI, and
+        UnitSystem('inch', 'kip', 'sec') or Imperial.
+
+    The value of every unit in the system is computed once into a lookup table
+    (a NumPy array); it is read as an attribute or an item:
+        unit = UnitSystem.Imperial
+        colHeight = 14*unit.ft
+        Fy = 50*unit['ksi']
+    convert(values, fromUnit, toUnit) - convert a scalar or an array of values
+        in one vectorized operation, e.g. a ground-motion record from g to
+        cm/sec²: convert(accel, 'g', 'cm/sec2'); both units must have the same
+        dimension
+    factor(fromUnit, toUnit) - the conversion factor of convert
+
+Units can be combined with '*', '/' and a power digit, e.g. 'kN*m', 'kip/in2',
+'m/sec2'.
+'''
+
+import re
+import math
+from fractions import Fraction
+
+import numpy as np
+
+
+# units in SI and their dimension, values are exact fractions so that e.g. ft is exactly 12 inch
+#   name: [value in m, N, sec; exponent of length, force, time]
+_m, _N, _sec = Fraction(1), Fraction(1), Fraction(1)
+_inch = Fraction('0.0254')*_m
+_ft = 12*_inch
+_kip = Fraction('4448.2216')*_N
+_lbf = _kip/1000
+_g = Fraction('9.80665')*_m/_sec**2
+_units = {
+    # length
+    'm':      [_m,                   1, 0, 0],
+    'cm':     [_m/100,               1, 0, 0],      # centimeter, needed for displacement input in Multiple Support excitation
+    'mm':     [_m/1000,              1, 0, 0],      # mili-meter
+    'inch':   [_inch,                1, 0, 0],
+    'in':     [_inch,                1, 0, 0],
+    'ft':     [_ft,                  1, 0, 0],      # foot
+    # force
+    'N':      [_N,                   0, 1, 0],
+    'kN':     [1000*_N,              0, 1, 0],      # kilo-Newton
+    'MN':     [10**6*_N,             0, 1, 0],      # Mega-Newton
+    'kip':    [_kip,                 0, 1, 0],
+    'lbf':    [_lbf,                 0, 1, 0],      # pounds force
+    'kgf':    [_g/_m*_N,             0, 1, 0],      # kilo-gram-force
+    'tonf':   [1000*_g/_m*_N,        0, 1, 0],      # tonne-force
+    # time
+    'sec':    [_sec,                 0, 0, 1],
+    # angle
+    'rad':    [Fraction(1),          0, 0, 0],
+    'degree': [Fraction(math.pi/180), 0, 0, 0],
+    # mass
+    'kg':     [_N*_sec**2/_m,       -1, 1, 2],
+    'ton':    [1000*_N*_sec**2/_m,  -1, 1, 2],      # metric tonne equal to 1,000 kilo-gram
+    'Slug':   [_kip*_sec**2/_inch,  -1, 1, 2],      # kip-s²/in
+    'slug':   [_lbf*_sec**2/_ft,    -1, 1, 2],      # Imperial mass = slug or pound-square second per foot
+    # acceleration
+    'g':      [_g,                   1, 0, -2],     # gravitational acceleration
+    # stress
+    'Pa':     [_N/_m**2,            -2, 1, 0],      # Newton per square meter
+    'kPa':    [1000*_N/_m**2,       -2, 1, 0],      # kilo-Pascal
+    'MPa':    [10**6*_N/_m**2,      -2, 1, 0],      # Mega-Pascal
+    'GPa':    [10**9*_N/_m**2,      -2, 1, 0],      # Giga-Pascal
+    'psi':    [_lbf/_inch**2,       -2, 1, 0],      # pounds per square inch
+    'ksi':    [_kip/_inch**2,       -2, 1, 0],      # kilo-pounds per square inch
+    'psf':    [_lbf/_ft**2,         -2, 1, 0],      # pounds per square foot
+    # distributed load and weight density
+    'plf':    [_lbf/_ft,            -1, 1, 0],      # pounds per linear foot
+    'pcf':    [_lbf/_ft**3,         -3, 1, 0],      # pounds per cubic foot
+    }
+
+# powers of length
+for _name in ['m', 'cm', 'mm', 'in', 'ft']:
+    for _power in [2, 3, 4]:
+        _units[_name + str(_power)] = [_units[_name][0]**_power, _power, 0, 0]
+
+_names = list(_units)
+_index = {name: i for i, name in enumerate(_names)}
+_dimension = np.array([_units[name][1:] for name in _names])
+
+_term = re.compile(r'([A-Za-z]+?)(\d?)$')
+
+
+class UnitSystem:
+
+    def __init__(self, length='m', force='N', time='sec'):
+        self.LunitTXT = length
+        self.FunitTXT = force
+        self.TunitTXT = time
+        # value in SI of the basic units of this system
+        base = [_units[length][0], _units[force][0], _units[time][0]]
+        # value of every unit in this system, computed once and exactly, then stored as a float array
+        self.table = np.array([float(_units[name][0] / (base[0]**L * base[1]**F * base[2]**T))
+                               for name, (L, F, T) in zip(_names, _dimension.tolist())])
+
+    def __getattr__(self, name):
+        if name.startswith('_') or name == 'table':
+            raise AttributeError(name)
+        try:
+            return float(self.table[_index[name]])
+        except KeyError:
+            raise AttributeError('unknown unit: ' + name) from None
+
+    def __getitem__(self, name):
+        return self._parse(name)[0]
+
+    def _parse(self, name):
+        # value and dimension of a unit or of a product/quotient of units
+        value = 1.0
+        dimension = np.zeros(3, dtype=int)
+        sign = 1
+        for token in re.split(r'([*/])', name.replace(' ', '')):
+            if token in ('*', '/'):
+                sign = 1 if token == '*' else -1
+                continue
+            if token in _index:
+                unit, power = token, 1
+            else:
+                match = _term.match(token)
+                if match is None or match.group(1) not in _index:
+                    raise ValueError('unknown unit: ' + token)
+                unit, power = match.group(1), int(match.group(2) or 1)
+            value *= self.table[_index[unit]]**(sign*power)
+            dimension += sign*power*_dimension[_index[unit]]
+        return value, dimension
+
+    def factor(self, fromUnit, toUnit):
+        fromValue, fromDimension = self._parse(fromUnit)
+        toValue, toDimension = self._parse(toUnit)
+        if not np.array_equal(fromDimension, toDimension):
+            raise ValueError('cannot convert ' + fromUnit + ' to ' + toUnit)
+        return fromValue/toValue
+
+    def convert(self, values, fromUnit, toUnit):
+        return np.asarray(values, dtype=float) * self.factor(fromUnit, toUnit)
+
+    def as_dict(self):
+        return {name: float(value) for name, value in zip(_names, self.table)}
+
+
+UnitSystem.SI = UnitSystem('m', 'N', 'sec')
+UnitSystem.Imperial = UnitSystem('inch', 'kip', 'sec')